@@ -3,37 +3,33 @@ PPT 생성 관련 Pydantic 스키마
 요청/응답 모델 정의
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, StringConstraints, validator
+from typing import Annotated, Literal, Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
-from enum import Enum
 
-class JobStatus(str, Enum):
-    """작업 상태"""
+class JobStatus:
+    """작업 상태 (문자열 상수 - DB 조회 시 Enum 변환 비용 제거)"""
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+# Literal은 pydantic-core가 직접 검증하고 OpenAPI 스키마에 enum으로 노출
+JobStatusField = Literal["pending", "in_progress", "completed", "failed", "cancelled"]
+
 class PPTRequest(BaseModel):
     """PPT 생성 요청 스키마"""
     
-    document: str = Field(..., min_length=10, description="입력 문서 텍스트")
+    # 공백 제거와 최소 길이 검증은 pydantic-core에서 한 번에 처리
+    document: Annotated[str, StringConstraints(strip_whitespace=True, min_length=10)] = Field(..., description="입력 문서 텍스트")
     num_slides: int = Field(default=10, ge=1, le=100, description="생성할 슬라이드 수")
     target_audience: Optional[str] = Field(default="executive", description="대상 청중")
     presentation_purpose: Optional[str] = Field(default="analysis", description="프레젠테이션 목적")
     template: Optional[str] = Field(default="McKinsey Professional", description="사용할 템플릿")
     enable_ai_enhancement: bool = Field(default=True, description="AI 개선 사용 여부")
     
-    @validator('document')
-    def validate_document(cls, v):
-        """문서 유효성 검증"""
-        if len(v.strip()) < 10:
-            raise ValueError("문서는 최소 10자 이상이어야 합니다")
-        return v.strip()
-    
     @validator('target_audience')
     def validate_audience(cls, v):
         """대상 청중 유효성 검증"""
@@ -75,7 +71,7 @@ class PPTResponse(BaseModel):
     """PPT 생성 응답 스키마"""
     
     job_id: UUID = Field(..., description="작업 ID")
-    status: JobStatus = Field(..., description="작업 상태")
+    status: JobStatusField = Field(..., description="작업 상태")
     download_url: Optional[str] = Field(None, description="다운로드 URL")
     file_path: Optional[str] = Field(None, description="파일 경로")
     quality_score: Optional[float] = Field(None, ge=0, le=1, description="품질 점수")
@@ -112,7 +108,7 @@ class StatusResponse(BaseModel):
     """작업 상태 조회 응답"""
     
     job_id: UUID = Field(..., description="작업 ID")
-    status: JobStatus = Field(..., description="현재 상태")
+    status: JobStatusField = Field(..., description="현재 상태")
     progress: Optional[int] = Field(None, ge=0, le=100, description="진행률 (%)")
     current_step: Optional[str] = Field(None, description="현재 진행 중인 단계")
     estimated_time_remaining: Optional[int] = Field(None, description="예상 남은 시간 (초)")
@@ -144,7 +140,7 @@ class JobDetails(BaseModel):
     """작업 상세 정보"""
     
     job_id: UUID
-    status: JobStatus
+    status: JobStatusField
     input_document: str
     num_slides: int
     target_audience: str
@@ -1,10 +1,9 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Literal, Optional, List, Dict, Any
 from datetime import datetime
-from enum import Enum
 
-class SlideLayout(str, Enum):
-    """Available slide layouts"""
+class SlideLayout:
+    """Available slide layouts (plain string constants)"""
     TITLE = "title"
     CONTENT = "content"
     TWO_COLUMN = "two_column"
@@ -16,8 +15,8 @@ class SlideLayout(str, Enum):
     COMPARISON = "comparison"
     TIMELINE = "timeline"
 
-class ChartType(str, Enum):
-    """Available chart types"""
+class ChartType:
+    """Available chart types (plain string constants)"""
     COLUMN = "column"
     BAR = "bar"
     LINE = "line"
@@ -25,21 +24,37 @@ class ChartType(str, Enum):
     AREA = "area"
     SCATTER = "scatter"
 
+# Literal fields are checked natively by pydantic-core and stay enums in the OpenAPI schema
+SlideLayoutField = Literal[
+    "title", "content", "two_column", "chart", "table", "image",
+    "blank", "section_header", "comparison", "timeline"
+]
+ChartTypeField = Literal["column", "bar", "line", "pie", "area", "scatter"]
+
+# Payload caps, enforced by pydantic-core while validating the request body
+MAX_SLIDE_BULLETS = 100
+MAX_CHART_POINTS = 10_000
+MAX_TABLE_ROWS = 1000
+MAX_TABLE_COLUMNS = 50
+
+ChartSeries = Annotated[List[float], Field(max_length=MAX_CHART_POINTS)]
+TableRow = Annotated[List[str], Field(max_length=MAX_TABLE_COLUMNS)]
+
 class SlideRequest(BaseModel):
     """Request schema for creating a slide"""
     title: str = Field(..., min_length=1, max_length=255)
     subtitle: Optional[str] = None
-    content: Optional[List[str]] = None
-    layout_type: SlideLayout = SlideLayout.CONTENT
+    content: Optional[List[str]] = Field(None, max_length=MAX_SLIDE_BULLETS)
+    layout_type: SlideLayoutField = SlideLayout.CONTENT
     speaker_notes: Optional[str] = None
     
     # Chart data
-    chart_type: Optional[ChartType] = None
-    chart_data: Optional[Dict[str, List[float]]] = None
+    chart_type: Optional[ChartTypeField] = None
+    chart_data: Optional[Dict[str, ChartSeries]] = None
     
     # Table data
     table_headers: Optional[List[str]] = None
-    table_data: Optional[List[List[str]]] = None
+    table_data: Optional[List[TableRow]] = Field(None, max_length=MAX_TABLE_ROWS)
     
     # Image
     image_url: Optional[str] = None
@@ -5,28 +5,58 @@ AI Service for generating high-quality presentation content using OpenAI
 import os
 import json
 from typing import Dict, Any, List, Optional
-from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception, wait_exponential, stop_after_attempt
 from app.core.logging import app_logger
 from app.core.config import settings
-from dotenv import load_dotenv
 from pathlib import Path
 
-# Load environment variables from .env file
+# .env location; loading (and the openai import) is deferred until the service is first used
 env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(env_path)
 
-# Debug: Print env path and check if file exists
-print(f"Looking for .env file at: {env_path}")
-print(f".env file exists: {env_path.exists()}")
 
-# If API key not found in environment, set it directly from .env file
-if not os.getenv("OPENAI_API_KEY") and env_path.exists():
-    with open(env_path, 'r') as f:
-        for line in f:
-            if line.startswith('OPENAI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip()
-                os.environ['OPENAI_API_KEY'] = api_key
-                print(f"Manually loaded API key from .env: {api_key[:10]}...")
+# override flags already applied by _load_env in this process
+_env_loaded_modes = set()
+
+
+def _load_env(override: bool = False) -> None:
+    """Load environment variables from .env once per process (and once more with override)"""
+    if override in _env_loaded_modes:
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv(env_path, override=override)
+    app_logger.debug(f".env file at {env_path} (exists: {env_path.exists()})")
+
+    # If API key not found in environment, set it directly from .env file
+    if not os.getenv("OPENAI_API_KEY") and env_path.exists():
+        with open(env_path, 'r') as f:
+            for line in f:
+                if line.startswith('OPENAI_API_KEY='):
+                    os.environ['OPENAI_API_KEY'] = line.split('=', 1)[1].strip()
+                    app_logger.debug("Loaded OPENAI_API_KEY directly from .env")
+
+    _env_loaded_modes.add(override)
+
+
+def _is_transient_openai_error(exc: BaseException) -> bool:
+    """Rate limits, timeouts and connection drops are worth retrying; anything else is not"""
+    from openai import RateLimitError, APITimeoutError, APIConnectionError
+    return isinstance(exc, (RateLimitError, APITimeoutError, APIConnectionError))
+
+
+# Static parts of the enhancement prompt; only the markdown and context vary per call
+_ENHANCE_HEADER = "Enhance this presentation content to McKinsey quality standards:"
+_ENHANCE_REQUIREMENTS = """Requirements:
+1. Add specific data points and metrics where generic statements exist
+2. Convert observations into actionable insights
+3. Add executive summary if missing
+4. Structure content using MECE principle
+5. Add "So What?" implications for each major point
+6. Include implementation roadmap where applicable
+7. Add risk mitigation strategies
+8. Quantify expected outcomes
+
+Keep the markdown format but improve the content quality significantly."""
 
 
 class AIService:
@@ -36,14 +66,27 @@ class AIService:
     
     def __init__(self):
         """Initialize AI service with OpenAI client"""
+        _load_env()
         self.api_key = os.getenv("OPENAI_API_KEY")
         if self.api_key:
-            self.client = AsyncOpenAI(api_key=self.api_key)
+            from openai import AsyncOpenAI
+            # Retries are handled by tenacity in _create_completion only
+            self.client = AsyncOpenAI(api_key=self.api_key, max_retries=0)
             self.model = "gpt-4"  # Use GPT-4 for better quality
         else:
             app_logger.warning("OpenAI API key not found. AI features will be limited.")
             self.client = None
-            
+
+    @retry(
+        retry=retry_if_exception(_is_transient_openai_error),
+        wait=wait_exponential(multiplier=0.5, max=8),
+        stop=stop_after_attempt(4),
+        reraise=True
+    )
+    async def _create_completion(self, **kwargs):
+        """Chat completion with retries on transient OpenAI errors"""
+        return await self.client.chat.completions.create(**kwargs)
+
     async def enhance_markdown_content(self, markdown_text: str, context: Dict[str, Any] = None) -> str:
         """
         Enhance markdown content with AI-generated insights in Korean
@@ -69,7 +112,7 @@ class AIService:
             각 슬라이드는 5-7개의 핵심 포인트로 구성하세요.
             """
             
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 한국 맥킨지의 시니어 컨설턴트입니다. 한글로 고품질 프레젠테이션을 작성하세요."},
@@ -94,7 +137,7 @@ class AIService:
             return "Executive Summary\n\n• Key findings\n• Strategic recommendations\n• Next steps"
             
         try:
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a McKinsey consultant creating executive summaries."},
@@ -119,7 +162,7 @@ class AIService:
             
         try:
             data_str = json.dumps(data, indent=2)
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are a data analyst providing McKinsey-level insights."},
@@ -173,7 +216,7 @@ class AIService:
             }}
             """
             
-            response = await self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "당신은 한국 맥킨지 컨설턴트입니다. 한글로 간결하고 임팩트 있는 슬라이드를 만드세요. 반드시 유효한 JSON 형식으로 응답하세요."},
@@ -213,7 +256,117 @@ class AIService:
         except Exception as e:
             app_logger.error(f"Slide improvement failed: {str(e)}")
             return slide
-    
+
+    async def generate_all(self, markdown: str, slides: List[Dict[str, Any]], data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate executive summary, data insights and per-slide improvements in a single call
+
+        Replaces the 2 + N round-trips of generate_executive_summary, generate_data_insights
+        and improve_slide_content with one request. Returns a dict with the keys
+        'executive_summary', 'insights' and 'slides'.
+        """
+        fallback = {
+            "executive_summary": "Executive Summary\n\n• Key findings\n• Strategic recommendations\n• Next steps",
+            "insights": ["Data shows positive trends", "Further analysis recommended"],
+            "slides": slides,
+        }
+        if not self.client:
+            return fallback
+
+        try:
+            slide_lines = []
+            for index, slide in enumerate(slides):
+                content_list = slide.get('content', [])
+                if isinstance(content_list, list):
+                    content_text = ' / '.join(str(item) for item in content_list[:10])
+                else:
+                    content_text = str(content_list)[:500]
+                slide_lines.append(f"[{index}] 제목: {slide.get('title', '')} | 내용: {content_text}")
+            slides_text = '\n'.join(slide_lines)
+
+            prompt = f"""
+            아래 세 가지 작업을 한 번에 수행하고 하나의 JSON 객체로 응답해주세요.
+
+            SECTION A: executive summary
+            다음 내용에 대한 간결한 Executive Summary를 작성하세요:
+            {markdown[:3000]}
+
+            SECTION B: data insights
+            다음 데이터에서 3-5개의 핵심 인사이트를 도출하세요:
+            {json.dumps(data, ensure_ascii=False)}
+
+            SECTION C: improvements per slide
+            각 슬라이드를 맥킨지 스타일로 개선하세요 (핵심 메시지 3-5개, 각 15단어 이내, 구체적 수치 포함):
+            {slides_text}
+
+            JSON 형식으로 응답:
+            {{
+                "executive_summary": "Executive Summary 본문",
+                "insights": ["인사이트1", "인사이트2", "인사이트3"],
+                "slides": [
+                    {{"index": 0, "title": "개선된 제목 (20자 이내)", "content": ["포인트1", "포인트2"], "speaker_notes": "발표자 노트 (선택사항)"}}
+                ]
+            }}
+            """
+
+            response = await self._create_completion(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "당신은 한국 맥킨지의 시니어 컨설턴트입니다. 반드시 유효한 JSON 형식으로 응답하세요."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.5,
+                max_tokens=3000
+            )
+
+            response_text = response.choices[0].message.content
+            # Clean up response for JSON parsing
+            if '```json' in response_text:
+                response_text = response_text.split('```json')[1].split('```')[0]
+            elif '```' in response_text:
+                response_text = response_text.split('```')[1].split('```')[0]
+
+            result = json.loads(response_text.strip())
+
+            improved_by_index = {}
+            for item in result.get('slides', []):
+                if isinstance(item, dict) and isinstance(item.get('index'), int):
+                    improved_by_index[item['index']] = item
+
+            # New dicts per slide; the caller's slides are left untouched
+            improved_slides = []
+            for index, slide in enumerate(slides):
+                improved = improved_by_index.get(index)
+                if improved:
+                    improved_content = improved.get('content', slide.get('content', []))
+                    if isinstance(improved_content, list):
+                        improved_content = [str(item)[:100] for item in improved_content[:5]]
+                    slide = {
+                        **slide,
+                        'title': str(improved.get('title', slide.get('title', '')))[:50],
+                        'content': improved_content,
+                    }
+                    if 'speaker_notes' in improved:
+                        slide['speaker_notes'] = improved['speaker_notes']
+                improved_slides.append(slide)
+
+            insights = result.get('insights') or fallback['insights']
+            if isinstance(insights, str):
+                insights = [line.strip() for line in insights.split('\n') if line.strip()]
+
+            return {
+                "executive_summary": result.get('executive_summary') or fallback['executive_summary'],
+                "insights": insights,
+                "slides": improved_slides,
+            }
+
+        except json.JSONDecodeError as e:
+            app_logger.error(f"Combined generation JSON parsing failed: {str(e)}")
+            return fallback
+        except Exception as e:
+            app_logger.error(f"Combined generation failed: {str(e)}")
+            return fallback
+
     def _get_system_prompt(self) -> str:
         """Get system prompt for McKinsey-style content"""
         return """
@@ -236,23 +389,7 @@ class AIService:
     
     def _build_enhancement_prompt(self, markdown_text: str, context: Dict[str, Any] = None) -> str:
         """Build prompt for content enhancement"""
-        prompt = f"""
-        Enhance this presentation content to McKinsey quality standards:
-        
-        {markdown_text}
-        
-        Requirements:
-        1. Add specific data points and metrics where generic statements exist
-        2. Convert observations into actionable insights
-        3. Add executive summary if missing
-        4. Structure content using MECE principle
-        5. Add "So What?" implications for each major point
-        6. Include implementation roadmap where applicable
-        7. Add risk mitigation strategies
-        8. Quantify expected outcomes
-        
-        Keep the markdown format but improve the content quality significantly.
-        """
+        prompt = f"{_ENHANCE_HEADER}\n\n{markdown_text}\n\n{_ENHANCE_REQUIREMENTS}"
         
         if context:
             prompt += f"\n\nContext: {json.dumps(context, indent=2)}"
@@ -308,13 +445,12 @@ def get_ai_service() -> AIService:
     """
     Get AI service instance (real or mock based on API key availability)
     """
-    # Re-load environment variables when getting AI service
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    load_dotenv(env_path, override=True)
+    # .env values take precedence over the process environment (applied once)
+    _load_env()
+    _load_env(override=True)
     
     api_key = os.getenv("OPENAI_API_KEY")
     app_logger.info(f"Checking for OpenAI API key: {'Found' if api_key else 'Not found'}")
-    app_logger.info(f"API key starts with: {api_key[:10] if api_key else 'None'}")
     
     if api_key:
         app_logger.info("Using real AI Service with OpenAI")
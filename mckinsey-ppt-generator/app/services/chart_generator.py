@@ -1,19 +1,132 @@
-import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')  # GUI 없는 환경
-from typing import Dict, List
+from matplotlib import font_manager
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# 차트 생성에 필요 없는 기능을 끈 최소 비용 설정 (import 시 한 번만 적용)
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+    'text.hinting': 'none',
+    'font.family': 'DejaVu Sans',
+    'svg.fonttype': 'none',
+})
+# 첫 차트에서 폰트 검색 비용이 발생하지 않도록 미리 조회
+font_manager.findfont(font_manager.FontProperties(family='DejaVu Sans'))
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import io
+import json
+import math
 import os
 import logging
+import threading
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Pillow 직접 렌더링 (단순 막대/파이 차트용) 설정
+FAST_CANVAS_SIZE = (1200, 750)
+
+# Matplotlib 저장 옵션: bbox_inches='tight' 재렌더링 없이 100dpi, 낮은 zlib 압축 (임시 슬라이드 자산용)
+SAVEFIG_KWARGS = {'dpi': 100, 'facecolor': 'white', 'pil_kwargs': {'compress_level': 1}}
+
+# 동일 스펙 차트 재사용 캐시 크기 (스펙 해시 -> 파일 경로)
+SPEC_CACHE_SIZE = 256
+
+# 재사용할 figsize별 Figure 수 (기본 크기 3종 + target_px 하나; 초과 시 오래된 것부터 해제)
+FIG_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=16)
+def _get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """Matplotlib 번들 DejaVu 폰트를 크기별로 한 번만 로드"""
+    name = 'DejaVuSans-Bold.ttf' if bold else 'DejaVuSans.ttf'
+    path = os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf', name)
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def _json_default(value):
+    """스펙 해시용 JSON 변환 (numpy 값은 축약된 str() 대신 전체 값으로)"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """인코딩된 PNG 바이트를 파일로 기록 (백그라운드 스레드에서 실행)"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _init_chart_worker() -> None:
+    """프로세스 풀 워커 초기화 (GUI 백엔드 탐색 방지)"""
+    matplotlib.use('Agg')
+
+
+# 워커 프로세스별 ChartGenerator (Figure 캐시를 작업 간 재사용)
+_worker_generator: Optional['ChartGenerator'] = None
+
+
+def _render_one(spec: Dict, output_dir: str, colors: Dict[str, str], color_sequence: List[str]) -> str:
+    """프로세스 풀에서 차트 하나를 렌더링하고 파일 경로 반환"""
+    global _worker_generator
+    if _worker_generator is None or _worker_generator.output_dir != output_dir:
+        _worker_generator = ChartGenerator(output_dir)
+    _worker_generator.colors = colors
+    _worker_generator.color_sequence = color_sequence
+    # 스펙 캐시는 부모 프로세스가 관리 (워커 쪽 캐시는 부모가 덮어쓴 파일을 알 수 없음)
+    _worker_generator._spec_to_path.clear()
+    filepath = _worker_generator.generate_chart(spec)
+    _worker_generator.flush()  # 부모 프로세스가 결과 파일을 바로 읽을 수 있도록
+    return filepath
+
+
+def _waterfall_kernel(v: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    워터폴 막대 높이/바닥/색상 인덱스 계산
+    
+    색상 인덱스: 0=neutral, 1=positive, 2=negative, 3=primary (Start/End)
+    """
+    n = v.size
+    heights = v.copy()
+    bottoms = np.zeros(n)
+    if n > 2:
+        bottoms[1:n - 1] = np.cumsum(v[:n - 2])
+    color_idx = (v > 0).astype(np.int8) + 2 * (v < 0).astype(np.int8)
+    if n > 0:
+        color_idx[0] = 3
+        color_idx[n - 1] = 3
+    return heights, bottoms, color_idx
+
+
+# numba가 설치된 경우 커널을 JIT 컴파일 (배치 렌더링 시 첫 호출 이후 캐시 사용)
+if njit is not None:
+    _waterfall_kernel = njit(cache=True)(_waterfall_kernel)
+
 
 class ChartGenerator:
     """McKinsey 스타일 차트 생성기"""
     
-    def __init__(self):
-        self.output_dir = "/app/temp_charts"
-        os.makedirs(self.output_dir, exist_ok=True)
+    def __init__(self, output_dir: str = "/app/temp_charts"):
+        self.output_dir = output_dir
         
         # McKinsey 색상 팔레트
         self.colors = {
@@ -27,8 +140,51 @@ class ChartGenerator:
         # color_sequence 추가 (stacked_bar_chart에서 사용)
         self.color_sequence = ['#0076A8', '#F47621', '#6BA644', '#E31B23', '#53565A']
         
+        # 차트마다 반복 생성하던 스타일 인자 (colors 설정 시 팔레트도 함께 갱신)
+        self._title_kwargs = {'fontsize': 14, 'fontweight': 'bold', 'pad': 20}
+        self._label_kwargs = {'fontsize': 11, 'fontweight': 'bold'}
+        
+        # figsize별 Figure/Axes 재사용 (매 차트마다 Figure/renderer 재생성 방지)
+        self._fig_cache: 'OrderedDict[Tuple[float, float], Tuple[Figure, Axes]]' = OrderedDict()
+        self._twin_cache: Dict[Tuple[float, float], Axes] = {}
+        # 캐시된 Figure/Axes를 재사용하므로 렌더링 전체를 직렬화
+        self._render_lock = threading.RLock()
+        
+        # 다중 차트 병렬 렌더링용 프로세스 풀 (generate_charts 첫 호출 시 생성)
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        
+        # 스펙 해시 -> 렌더링된 파일 경로 (LRU, id를 제외한 내용이 같으면 재렌더링 생략)
+        self._spec_to_path: 'OrderedDict[str, str]' = OrderedDict()
+        
+        # 메모리에서 인코딩한 PNG를 백그라운드로 기록 (다음 차트 렌더링과 디스크 쓰기를 겹침)
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes: Dict[str, Future] = {}
+        
         logger.info("ChartGenerator initialized")
     
+    @property
+    def output_dir(self) -> str:
+        return self._output_dir
+    
+    @output_dir.setter
+    def output_dir(self, value: str) -> None:
+        """출력 디렉터리 생성은 설정 시 한 번만, 파일 경로 접두사도 미리 계산"""
+        os.makedirs(value, exist_ok=True)
+        self._output_dir = value
+        self._path_prefix = f"{value.rstrip('/')}/chart_"
+    
+    @property
+    def colors(self) -> Dict[str, str]:
+        return self._colors
+    
+    @colors.setter
+    def colors(self, value: Dict[str, str]) -> None:
+        """팔레트 설정 시 파이/워터폴 색상 튜플도 미리 계산"""
+        self._colors = value
+        self._pie_colors = (value['primary'], value['secondary'], value['positive'], value['neutral'])
+        # _waterfall_kernel 색상 인덱스 순서 (0=neutral, 1=positive, 2=negative, 3=primary)
+        self._waterfall_palette = (value['neutral'], value['positive'], value['negative'], value['primary'])
+    
     def generate_chart(self, chart_spec: Dict) -> str:
         """
         차트 생성 및 이미지 파일 경로 반환
@@ -38,28 +194,46 @@ class ChartGenerator:
                 'type': 'bar' | 'line' | 'pie' | 'waterfall',
                 'data': {...},
                 'title': str,
-                'id': str
+                'id': str,
+                'target_px': (W, H)  # 선택: 삽입될 자리의 픽셀 크기로 바로 렌더링
             }
         
         Returns:
-            이미지 파일 절대 경로
+            이미지 파일 절대 경로 (PNG는 백그라운드 스레드에서 기록되므로
+            파일을 읽기 전에 flush()를 호출해야 함)
         """
         chart_type = chart_spec.get('type', 'bar')
         
+        cache_key = self._spec_key(chart_spec)
+        cached_path = self._lookup_cached(cache_key)
+        if cached_path:
+            logger.info(f"차트 캐시 사용: {cached_path}")
+            return cached_path
+        
         logger.info(f"차트 생성 시작: {chart_type} - {chart_spec.get('title', 'Untitled')}")
         
+        # 단순 차트는 Matplotlib 파이프라인 대신 Pillow로 직접 그림 ('fast': False로 비활성화)
+        use_fast = chart_spec.get('fast', True)
+        
         try:
-            if chart_type == 'bar':
-                filepath = self._create_bar_chart(chart_spec)
-            elif chart_type == 'line':
-                filepath = self._create_line_chart(chart_spec)
-            elif chart_type == 'pie':
-                filepath = self._create_pie_chart(chart_spec)
-            elif chart_type == 'waterfall':
-                filepath = self._create_waterfall_chart(chart_spec)
+            if use_fast and chart_type == 'pie':
+                filepath = self._create_pie_chart_fast(chart_spec)
+            elif use_fast and chart_type not in ('line', 'waterfall'):
+                filepath = self._create_bar_chart_fast(chart_spec)
             else:
-                filepath = self._create_bar_chart(chart_spec)
+                with self._render_lock:
+                    if chart_type == 'bar':
+                        filepath = self._create_bar_chart(chart_spec)
+                    elif chart_type == 'line':
+                        filepath = self._create_line_chart(chart_spec)
+                    elif chart_type == 'pie':
+                        filepath = self._create_pie_chart(chart_spec)
+                    elif chart_type == 'waterfall':
+                        filepath = self._create_waterfall_chart(chart_spec)
+                    else:
+                        filepath = self._create_bar_chart(chart_spec)
             
+            self._remember(cache_key, filepath)
             logger.info(f"차트 생성 완료: {filepath}")
             return filepath
             
@@ -67,9 +241,287 @@ class ChartGenerator:
             logger.error(f"차트 생성 실패: {e}")
             raise
     
+    def generate_charts(self, specs: List[Dict]) -> List[str]:
+        """
+        여러 차트를 프로세스 풀에서 병렬 생성
+        
+        Args:
+            specs: generate_chart와 동일한 형식의 chart_spec 목록
+        
+        Returns:
+            입력 순서대로 정렬된 이미지 파일 경로 목록 (반환 시점에 모두 기록 완료)
+        """
+        if len(specs) <= 1:
+            paths = [self.generate_chart(spec) for spec in specs]
+            self.flush()
+            return paths
+        
+        keys = [self._spec_key(spec) for spec in specs]
+        paths: List[Optional[str]] = [self._lookup_cached(key) for key in keys]
+        pending = [i for i, path in enumerate(paths) if path is None]
+        if not pending:
+            self.flush()  # 캐시된 경로도 아직 백그라운드 쓰기 중일 수 있음
+            return paths
+        
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                initializer=_init_chart_worker
+            )
+        
+        # 같은 배치 안의 동일 스펙은 한 번만 렌더링
+        futures = {}
+        for i in pending:
+            if keys[i] not in futures:
+                futures[keys[i]] = self._process_pool.submit(
+                    _render_one, specs[i], self.output_dir, self.colors, self.color_sequence
+                )
+        for key, future in futures.items():
+            self._remember(key, future.result())
+        for i in pending:
+            paths[i] = futures[keys[i]].result()
+        self.flush()
+        return paths
+    
+    def _spec_key(self, chart_spec: Dict) -> str:
+        """id를 제외한 차트 스펙 + 색상 설정의 안정적인 해시"""
+        content = {k: v for k, v in chart_spec.items() if k != 'id'}
+        payload = json.dumps([content, self.colors, self.color_sequence], sort_keys=True, default=_json_default)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def _lookup_cached(self, cache_key: str) -> Optional[str]:
+        """캐시된 파일 경로 반환 (파일이 삭제된 경우 None)"""
+        with self._render_lock:
+            path = self._spec_to_path.get(cache_key)
+            if path is None:
+                return None
+            if path not in self._pending_writes and not os.path.exists(path):
+                del self._spec_to_path[cache_key]
+                return None
+            self._spec_to_path.move_to_end(cache_key)
+            return path
+    
+    def _remember(self, cache_key: str, filepath: str) -> None:
+        """렌더링 결과 기록 (같은 파일을 가리키던 이전 스펙은 덮어써졌으므로 제거)"""
+        with self._render_lock:
+            stale = [key for key, path in self._spec_to_path.items() if path == filepath]
+            for key in stale:
+                del self._spec_to_path[key]
+            self._spec_to_path[cache_key] = filepath
+            while len(self._spec_to_path) > SPEC_CACHE_SIZE:
+                self._spec_to_path.popitem(last=False)
+    
+    def flush(self) -> None:
+        """대기 중인 차트 파일 쓰기가 모두 끝날 때까지 대기 (PPT 조립 전에 호출)"""
+        with self._render_lock:
+            pending = list(self._pending_writes.values())
+        for future in pending:
+            future.result()
+    
+    def _submit_write(self, filepath: str, data: bytes) -> None:
+        """PNG 바이트 쓰기를 백그라운드 스레드에 위임"""
+        with self._render_lock:
+            previous = self._pending_writes.get(filepath)
+            if previous is not None:
+                previous.result()  # 같은 파일에 대한 쓰기 순서 보장
+            future = self._io_pool.submit(_write_bytes, filepath, data)
+            self._pending_writes[filepath] = future
+        future.add_done_callback(lambda f, path=filepath: self._finish_write(path, f))
+    
+    def _finish_write(self, filepath: str, future: Future) -> None:
+        with self._render_lock:
+            if self._pending_writes.get(filepath) is future:
+                del self._pending_writes[filepath]
+        if future.exception() is not None:
+            logger.error(f"차트 파일 저장 실패: {filepath} - {future.exception()}")
+    
+    def _save_figure(self, fig: Figure, filepath: str) -> None:
+        """Matplotlib Figure를 메모리에서 PNG로 인코딩 후 비동기 저장"""
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', **SAVEFIG_KWARGS)
+        self._submit_write(filepath, buf.getvalue())
+    
+    def _save_image(self, img: Image.Image, filepath: str) -> None:
+        """Pillow 이미지를 메모리에서 PNG로 인코딩 후 비동기 저장"""
+        buf = io.BytesIO()
+        img.save(buf, format='PNG', compress_level=1)
+        self._submit_write(filepath, buf.getvalue())
+    
+    def __del__(self):
+        pool = getattr(self, '_process_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+        io_pool = getattr(self, '_io_pool', None)
+        if io_pool is not None:
+            io_pool.shutdown(wait=True)
+    
+    def _get_axes(self, figsize: Tuple[float, float]) -> Tuple[Figure, Axes]:
+        """figsize별로 캐시된 Figure/Axes 반환 (재사용 시 초기화)"""
+        cached = self._fig_cache.get(figsize)
+        if cached is None:
+            # pyplot(Gcf 전역 figure 관리자)을 거치지 않고 Agg 캔버스에 직접 연결
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+            self._fig_cache[figsize] = (fig, ax)
+            if len(self._fig_cache) > FIG_CACHE_SIZE:
+                # 가장 오래 쓰이지 않은 Figure 해제 (Agg 캔버스 버퍼 포함)
+                old_size, (old_fig, _) = self._fig_cache.popitem(last=False)
+                self._twin_cache.pop(old_size, None)
+                old_fig.clear()
+            return fig, ax
+        
+        self._fig_cache.move_to_end(figsize)
+        fig, ax = cached
+        twin = self._twin_cache.pop(figsize, None)
+        if twin is not None:
+            twin.remove()
+        ax.clear()
+        ax.set_prop_cycle(None)
+        for spine in ax.spines.values():
+            spine.set_visible(True)
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        return fig, ax
+    
+    def _get_twin_axes(self, figsize: Tuple[float, float], ax: Axes) -> Axes:
+        """콤보 차트용 보조 축 (Figure 재사용 시 다음 호출에서 제거됨)"""
+        twin = ax.twinx()
+        self._twin_cache[figsize] = twin
+        return twin
+    
+    @staticmethod
+    def _target_px(spec: Dict, default: Optional[Tuple[int, int]] = None) -> Optional[Tuple[int, int]]:
+        """spec['target_px'] (W, H)가 있으면 그 크기, 없으면 default"""
+        target = spec.get('target_px')
+        if not target:
+            return default
+        width, height = int(target[0]), int(target[1])
+        if width <= 0 or height <= 0:
+            raise ValueError(f"target_px must be positive: {target}")
+        return width, height
+    
+    def _figsize(self, spec: Dict, default: Tuple[float, float]) -> Tuple[float, float]:
+        """target_px를 저장 dpi 기준 인치로 환산 (저장 후 별도 리사이즈 불필요)"""
+        target = self._target_px(spec)
+        if target is None:
+            return default
+        dpi = SAVEFIG_KWARGS['dpi']
+        return (target[0] / dpi, target[1] / dpi)
+    
+    def _new_fast_canvas(self, title: str, size: Tuple[int, int] = FAST_CANVAS_SIZE) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+        """흰 배경 캔버스 생성 후 상단 중앙에 제목 표시"""
+        img = Image.new('RGB', size, 'white')
+        draw = ImageDraw.Draw(img)
+        draw.text((size[0] // 2, 40), title, fill='black',
+                  font=_get_font(28, bold=True), anchor='mt')
+        return img, draw
+    
+    def _create_bar_chart_fast(self, spec: Dict, categories: List = None, values: List = None) -> str:
+        """막대 차트 생성 (Pillow 직접 렌더링)"""
+        data = spec.get('data', {})
+        if categories is None:
+            categories = data.get('categories', ['A', 'B', 'C', 'D'])
+        if values is None:
+            values = data.get('values', [30, 45, 25, 50])
+        
+        width, height = self._target_px(spec, FAST_CANVAS_SIZE)
+        img, draw = self._new_fast_canvas(spec.get('title', 'Chart'), (width, height))
+        left, right, top, bottom = 90, width - 40, 120, height - 70
+        label_font = _get_font(18)
+        value_font = _get_font(20, bold=True)
+        
+        # 음수가 있으면 0 기준선을 플롯 영역 안으로 올려 아래쪽에 음수 막대를 그림
+        max_value = max([v for v in values if v > 0], default=0)
+        min_value = min([v for v in values if v < 0], default=0)
+        if max_value == 0 and min_value == 0:
+            max_value = 1
+        scale = (bottom - top) / ((max_value - min_value) * 1.1)
+        baseline = bottom + min_value * 1.1 * scale
+        
+        # y축 눈금 및 보조선
+        magnitude = max(max_value, -min_value)
+        step = 10 ** math.floor(math.log10(magnitude))
+        if magnitude / step < 3:
+            step /= 2
+        ticks = []
+        tick = 0.0
+        while tick <= max_value * 1.1:
+            ticks.append(tick)
+            tick += step
+        tick = -step
+        while tick >= min_value * 1.1:
+            ticks.append(tick)
+            tick -= step
+        for tick in ticks:
+            y = baseline - tick * scale
+            if tick != 0:
+                for x in range(left, right, 16):
+                    draw.line([(x, y), (min(x + 8, right), y)], fill='#DDDDDD', width=1)
+            draw.text((left - 10, y), f'{tick:g}', fill='black', font=label_font, anchor='rm')
+        
+        draw.line([(left, top), (left, bottom)], fill='black', width=2)
+        draw.line([(left, baseline), (right, baseline)], fill='black', width=2)
+        
+        # 막대 및 값 레이블 (음수 레이블은 막대 끝 아래)
+        slot = (right - left) / max(len(values), 1)
+        bar_width = slot * 0.6
+        for i, (category, value) in enumerate(zip(categories, values)):
+            center = left + slot * (i + 0.5)
+            bar_end = baseline - value * scale
+            draw.rectangle([center - bar_width / 2, min(bar_end, baseline), center + bar_width / 2, max(bar_end, baseline)],
+                           fill=self.colors['primary'])
+            if value < 0:
+                draw.text((center, bar_end + 6), f'{int(value)}', fill='black', font=value_font, anchor='ma')
+            else:
+                draw.text((center, bar_end - 6), f'{int(value)}', fill='black', font=value_font, anchor='md')
+            draw.text((center, bottom + 12), str(category), fill='black', font=label_font, anchor='mt')
+        
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        self._save_image(img, filepath)
+        
+        return filepath
+    
+    def _create_pie_chart_fast(self, spec: Dict) -> str:
+        """파이 차트 생성 (Pillow 직접 렌더링)"""
+        data = spec.get('data', {})
+        labels = data.get('labels', ['A', 'B', 'C', 'D'])
+        sizes = data.get('sizes', [30, 25, 20, 25])
+        colors = self._pie_colors
+        
+        width, height = self._target_px(spec, FAST_CANVAS_SIZE)
+        img, draw = self._new_fast_canvas(spec.get('title', 'Distribution'), (width, height))
+        # 제목 아래 영역 중앙 (기본 1200x750 캔버스에서 중심 (600, 420), 반지름 260)
+        cx, cy = width // 2, (height + 90) // 2
+        radius = max(min((height - 90) // 2 - 70, width // 2 - 140), 10)
+        label_font = _get_font(20, bold=True)
+        total = float(sum(sizes)) or 1.0
+        
+        # Matplotlib startangle=90(반시계) 와 동일하게 12시 방향에서 반시계 방향으로 배치
+        angle = -90.0
+        for i, (label, size) in enumerate(zip(labels, sizes)):
+            sweep = 360.0 * size / total
+            start, end = angle - sweep, angle
+            draw.pieslice([cx - radius, cy - radius, cx + radius, cy + radius],
+                          start, end, fill=colors[i % len(colors)])
+            
+            mid = math.radians((start + end) / 2)
+            draw.text((cx + radius * 0.6 * math.cos(mid), cy + radius * 0.6 * math.sin(mid)),
+                      f'{100.0 * size / total:.1f}%', fill='white', font=label_font, anchor='mm')
+            draw.text((cx + radius * 1.15 * math.cos(mid), cy + radius * 1.15 * math.sin(mid)),
+                      str(label), fill='black', font=label_font,
+                      anchor='lm' if math.cos(mid) >= 0 else 'rm')
+            angle = start
+        
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        self._save_image(img, filepath)
+        
+        return filepath
+    
     def _create_bar_chart(self, spec: Dict) -> str:
         """막대 차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 5))
+        fig, ax = self._get_axes(self._figsize(spec, (8, 5)))
         
         data = spec.get('data', {})
         categories = data.get('categories', ['A', 'B', 'C', 'D'])
@@ -79,37 +531,26 @@ class ChartGenerator:
         bars = ax.bar(categories, values, color=self.colors['primary'], width=0.6)
         
         # 값 레이블
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2.,
-                height,
-                f'{int(height)}',
-                ha='center',
-                va='bottom',
-                fontsize=11,
-                fontweight='bold'
-            )
+        ax.bar_label(bars, fmt='%d', padding=2, **self._label_kwargs)
         
         # 스타일 설정
         title = spec.get('title', 'Chart')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(title, **self._title_kwargs)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         ax.set_axisbelow(True)
         
         # 저장
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'temp')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
     
     def _create_line_chart(self, spec: Dict) -> str:
         """선 차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 5))
+        fig, ax = self._get_axes(self._figsize(spec, (8, 5)))
         
         data = spec.get('data', {})
         x_data = data.get('x', ['Q1', 'Q2', 'Q3', 'Q4'])
@@ -139,42 +580,34 @@ class ChartGenerator:
         
         # 스타일
         title = spec.get('title', 'Trend Analysis')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(title, **self._title_kwargs)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         ax.set_axisbelow(True)
         
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'temp')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
     
     def _create_pie_chart(self, spec: Dict) -> str:
         """파이 차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = self._get_axes(self._figsize(spec, (8, 6)))
         
         data = spec.get('data', {})
         labels = data.get('labels', ['A', 'B', 'C', 'D'])
         sizes = data.get('sizes', [30, 25, 20, 25])
         
-        colors = [
-            self.colors['primary'],
-            self.colors['secondary'],
-            self.colors['positive'],
-            self.colors['neutral']
-        ]
-        
         # 파이 차트
         wedges, texts, autotexts = ax.pie(
             sizes,
             labels=labels,
-            colors=colors,
+            colors=self._pie_colors,
             autopct='%1.1f%%',
             startangle=90,
-            textprops={'fontsize': 11, 'fontweight': 'bold'}
+            textprops=self._label_kwargs
         )
         
         # 스타일
@@ -182,20 +615,17 @@ class ChartGenerator:
             autotext.set_color('white')
         
         title = spec.get('title', 'Distribution')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(title, **self._title_kwargs)
         
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'temp')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
     
     def _create_waterfall_chart(self, spec: Dict) -> str:
         """워터폴 차트 생성 (McKinsey 필수)"""
-        import numpy as np
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._get_axes(self._figsize(spec, (10, 6)))
         
         data = spec.get('data', {})
         categories = data.get('categories', ['Start', 'Inc1', 'Inc2', 'Dec1', 'End'])
@@ -207,38 +637,13 @@ class ChartGenerator:
 
         # Calculate the 'bottom' and 'height' for each bar
         # The first bar is the starting value
-        # Intermediate bars are changes
+        # Intermediate bars are changes (stacked on the running total)
         # The last bar is the final total
-
-        # Initialize lists for heights and bottoms
-        heights = []
-        bottoms = []
-        running_total = 0
-
-        for i, val in enumerate(values):
-            if i == 0:  # First bar (Start)
-                heights.append(val)
-                bottoms.append(0)
-                running_total = val
-            elif i == len(values) - 1:  # Last bar (End)
-                heights.append(val)
-                bottoms.append(0)
-            else:  # Intermediate bars (Increments/Decrements)
-                heights.append(val)
-                bottoms.append(running_total)
-                running_total += val
-
-        # 막대 색상
-        colors_list = []
-        for i, val in enumerate(values):
-            if i == 0 or i == len(values) - 1: # Start and End bars are primary color
-                colors_list.append(self.colors['primary'])
-            elif val > 0:
-                colors_list.append(self.colors['positive'])
-            elif val < 0:
-                colors_list.append(self.colors['negative'])
-            else:
-                colors_list.append(self.colors['neutral'])
+        heights, bottoms, color_idx = _waterfall_kernel(np.asarray(values, dtype=np.float64))
+        
+        # 막대 색상: Start/End는 primary, 중간은 증감 부호별
+        palette = self._waterfall_palette
+        colors_list = [palette[i] for i in color_idx]
         
         # 워터폴 막대
         bars = ax.bar(
@@ -249,30 +654,23 @@ class ChartGenerator:
             width=0.6
         )
         
-        # 값 레이블
-        for i, (bar, val) in enumerate(zip(bars, values)):
-            y_pos = bar.get_y() + bar.get_height() / 2
-            
-            label = f'{int(val)}'
-            if i > 0 and i < len(values) - 1: # Only for intermediate changes, show +/- sign
-                label = f'+{int(val)}' if val > 0 else f'{int(val)}'
-            
-            ax.text(
-                bar.get_x() + bar.get_width() / 2,
-                y_pos,
-                label,
-                ha='center',
-                va='center',
-                fontsize=11,
-                fontweight='bold',
-                color='white' if bar.get_height() != 0 else 'black' # Label color based on bar height
-            )
+        # 값 레이블 (중간 증감 막대만 +/- 부호 표시)
+        last = len(values) - 1
+        labels = [
+            f'+{int(val)}' if 0 < i < last and val > 0 else f'{int(val)}'
+            for i, val in enumerate(values)
+        ]
+        texts = ax.bar_label(bars, labels=labels, label_type='center', color='white',
+                             **self._label_kwargs)
+        for text, height in zip(texts, heights):
+            if height == 0:
+                text.set_color('black')  # 높이 0인 막대는 배경 위에 표시
         
         # 연결선
         for i in range(len(categories) - 1):
             x_start = i + 0.3
             x_end = i + 0.7
-            y = bottoms[i+1] if i < len(bottoms) - 1 else running_total # Use the bottom of the next bar for connection
+            y = bottoms[i+1] # Use the bottom of the next bar for connection
             ax.plot([x_start, x_end], [y, y], 'k--', linewidth=1, alpha=0.5)
         
         # 스타일
@@ -280,17 +678,16 @@ class ChartGenerator:
         ax.set_xticklabels(categories, rotation=0)
         
         title = spec.get('title', 'Waterfall Analysis')
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(title, **self._title_kwargs)
         
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3, linestyle='--')
         ax.set_axisbelow(True)
         
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'temp')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
     
@@ -328,7 +725,7 @@ class ChartGenerator:
     
     def _create_stacked_bar_chart(self, spec: Dict) -> str:
         """적층 막대 차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 5))
+        fig, ax = self._get_axes(self._figsize(spec, (8, 5)))
         
         data = spec.get('data', {})
         categories = data.get('categories', ['Q1', 'Q2', 'Q3', 'Q4'])
@@ -349,17 +746,18 @@ class ChartGenerator:
             ]
             series_labels = ['Series 1', 'Series 2', 'Series 3']
         
-        # 적층 막대
+        # 적층 막대 (각 시리즈의 bottom = 이전 시리즈들의 누적합)
         x = np.arange(len(categories))
         width = 0.6
-        bottom = np.zeros(len(categories))
+        stack = np.asarray(series_data, dtype=np.float64)
+        bottoms = np.zeros_like(stack)
+        np.cumsum(stack[:-1], axis=0, out=bottoms[1:])
         
         bars = []
-        for i, (data_series, label) in enumerate(zip(series_data, series_labels)):
-            bar = ax.bar(x, data_series, width, label=label,
-                        bottom=bottom, color=self.color_sequence[i % len(self.color_sequence)])
+        for i, label in enumerate(series_labels):
+            bar = ax.bar(x, stack[i], width, label=label,
+                        bottom=bottoms[i], color=self.color_sequence[i % len(self.color_sequence)])
             bars.append(bar)
-            bottom += data_series
         
         # 스타일
         ax.set_xlabel(spec.get('x_label', ''))
@@ -374,16 +772,16 @@ class ChartGenerator:
         ax.grid(axis='y', alpha=0.3)
         ax.set_axisbelow(True)
         
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'temp')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath)
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
     
     def _create_combo_chart(self, spec: Dict) -> str:
         """콤보 차트 (막대 + 선) 생성"""
-        fig, ax1 = plt.subplots(figsize=(8, 5))
+        figsize = self._figsize(spec, (8, 5))
+        fig, ax1 = self._get_axes(figsize)
         
         data = spec.get('data', {})
         categories = data.get('categories', ['Q1', 'Q2', 'Q3', 'Q4'])
@@ -400,7 +798,7 @@ class ChartGenerator:
         ax1.tick_params(axis='y', labelcolor=self.colors['primary'])
         
         # 선 차트 (오른쪽 축)
-        ax2 = ax1.twinx()
+        ax2 = self._get_twin_axes(figsize, ax1)
         line = ax2.plot(x, line_values, color=self.colors['negative'], marker='o', linewidth=2.5, label='Margin %')
         ax2.set_ylabel('Margin (%)', color=self.colors['negative'])
         ax2.tick_params(axis='y', labelcolor=self.colors['negative'])
@@ -419,16 +817,22 @@ class ChartGenerator:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
         
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'temp')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath)
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'temp')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
     
     def _create_fallback_chart(self, spec: Dict) -> str:
         """실패 시 기본 차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 5))
+        if spec.get('fast', True):
+            return self._create_bar_chart_fast(
+                {**spec, 'id': spec.get('id', 'fallback')},
+                categories=['A', 'B', 'C', 'D'],
+                values=[25, 40, 30, 45]
+            )
+        
+        fig, ax = self._get_axes(self._figsize(spec, (8, 5)))
         
         # 기본 막대 차트
         categories = ['A', 'B', 'C', 'D']
@@ -436,15 +840,14 @@ class ChartGenerator:
         
         bars = ax.bar(categories, values, color=self.colors['primary'], width=0.6)
         
-        ax.set_title(spec.get('title', 'Chart'), fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(spec.get('title', 'Chart'), **self._title_kwargs)
         ax.spines['top'].set_visible(False)
         ax.spines['right'].set_visible(False)
         ax.grid(axis='y', alpha=0.3)
         ax.set_axisbelow(True)
         
-        filepath = os.path.join(self.output_dir, f"chart_{spec.get('id', 'fallback')}.png")
-        plt.tight_layout()
-        plt.savefig(filepath)
-        plt.close()
+        filepath = f"{self._path_prefix}{spec.get('id', 'fallback')}.png"
+        fig.tight_layout()
+        self._save_figure(fig, filepath)
         
         return filepath
\ No newline at end of file
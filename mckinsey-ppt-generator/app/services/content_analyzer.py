@@ -4,22 +4,64 @@ Analyzes markdown content to determine the best layout for each slide.
 """
 
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+import numpy as np
 from app.core.logging import app_logger
 
+# Detection patterns, compiled once at import and shared by every analyzer
+_BULLET_RE = re.compile(r'^[\s]*[\*\-\+•]\s+', re.MULTILINE)
+_TABLE_RE = re.compile(r'\|.*\|.*\|', re.MULTILINE)
+_IMAGE_RE = re.compile(r'!\[.*?\]\(.*?\)')
+_CHART_RE = re.compile(r'(?:chart|graph|diagram|matrix)', re.IGNORECASE)
+_MD_STRIP_RE = re.compile(r'[#*\[\]()]')
+# All detection patterns as one alternation so the markdown is scanned once.
+# Table/image are zero-width lookaheads so keywords inside them are still seen.
+_CONTENT_SCAN_RE = re.compile(
+    r'(?P<bullet>^[\s]*[\*\-\+•]\s+)'
+    r'|(?=(?P<table>\|.*\|.*\|))'
+    r'|(?=(?P<image>!\[.*?\]\(.*?\)))'
+    r'|(?P<matrix>matrix)'
+    r'|(?P<matrix_ko>매트릭스)'
+    r'|(?P<chart>chart|graph|diagram)',
+    re.IGNORECASE | re.MULTILINE
+)
+# Korean code point range counted by calculate_text_density (inclusive)
+_KOREAN_FIRST, _KOREAN_LAST = 0x3131, 0xCB4C
+
+# Per-layout (max items, max characters per item) used by optimize_content_for_layout
+_LAYOUT_LIMITS: Dict[str, Tuple[int, Optional[int]]] = {
+    "bullet_list": (5, 80),
+    "two_column": (8, 60),        # Max 4 per column
+    "three_column": (9, 40),      # Max 3 per column
+    "timeline": (4, 30),          # Max 4 milestones
+    "process_flow": (5, 40),      # Max 5 steps
+    "pyramid": (7, 25),           # Pyramid structure levels
+    "dashboard_grid": (6, 20),    # Max 6 KPIs
+    "quote_highlight": (1, 200),  # Single quote
+    "split_screen": (10, 300),    # Generous limit for panels
+    "agenda_toc": (5, 60),        # Max 5 agenda items
+}
+_DEFAULT_LAYOUT_LIMIT: Tuple[int, Optional[int]] = (7, None)
+
+
+def _scan_markdown(markdown: str) -> Dict[str, int]:
+    """Count bullet/table/image/matrix/chart matches in a single pass"""
+    counts = dict.fromkeys(_CONTENT_SCAN_RE.groupindex, 0)
+    for match in _CONTENT_SCAN_RE.finditer(markdown):
+        counts[match.lastgroup] += 1
+    return counts
+
 
 class ContentAnalyzer:
     """
-    마크다운 콘텐츠를 분석하여 최적 레이아웃 결정
+    마크다운 콘텐츠를 분석하여 최적 레이아웃 결정 (상태 없음 - 모듈 인스턴스 공유 가능)
     """
     
-    def __init__(self):
-        """Initialize content analyzer with detection patterns"""
-        self.bullet_pattern = re.compile(r'^[\s]*[\*\-\+•]\s+', re.MULTILINE)
-        self.table_pattern = re.compile(r'\|.*\|.*\|', re.MULTILINE)
-        self.image_pattern = re.compile(r'!\[.*?\]\(.*?\)')
-        self.chart_pattern = re.compile(r'(?:chart|graph|diagram|matrix)', re.IGNORECASE)
-        self.comparison_keywords = ['vs', 'versus', '대비', '비교', 'before', 'after', '이전', '이후']
+    bullet_pattern = _BULLET_RE
+    table_pattern = _TABLE_RE
+    image_pattern = _IMAGE_RE
+    chart_pattern = _CHART_RE
+    comparison_keywords = ('vs', 'versus', '대비', '비교', 'before', 'after', '이전', '이후')
         
     def analyze_slide_content(self, markdown_content: str, slide_title: str = "") -> Dict[str, Any]:
         """
@@ -52,19 +94,25 @@ class ContentAnalyzer:
                 "recommended_layout": "single_column"
             }
             
+            # Scan the markdown once and share the results with the helpers
+            scan = _scan_markdown(markdown_content)
+            bullet_count = scan["bullet"]
+            has_table = bool(scan["table"])
+            has_image = bool(scan["image"])
+            has_chart_kw = bool(scan["chart"] or scan["matrix"])
+            
             # Detect content type
-            content_type = self.detect_content_type(markdown_content, slide_title)
+            content_type = self.detect_content_type(markdown_content, slide_title, scan=scan)
             analysis["content_type"] = content_type
             
             # Count elements
-            bullet_count = len(self.bullet_pattern.findall(markdown_content))
             analysis["bullet_count"] = bullet_count
             analysis["element_count"] = bullet_count
             
             # Detect special elements
-            analysis["has_table"] = bool(self.table_pattern.search(markdown_content))
-            analysis["has_image"] = bool(self.image_pattern.search(markdown_content))
-            analysis["has_chart"] = bool(self.chart_pattern.search(markdown_content)) or analysis["has_table"]
+            analysis["has_table"] = has_table
+            analysis["has_image"] = has_image
+            analysis["has_chart"] = has_chart_kw or has_table
             
             # Calculate text density
             analysis["text_density"] = self.calculate_text_density(markdown_content)
@@ -97,7 +145,8 @@ class ContentAnalyzer:
                 "recommended_layout": "single_column"
             }
     
-    def detect_content_type(self, markdown: str, title: str = "") -> str:
+    def detect_content_type(self, markdown: str, title: str = "",
+                            scan: Optional[Dict[str, int]] = None) -> str:
         """
         콘텐츠 타입 감지
         
@@ -108,13 +157,20 @@ class ContentAnalyzer:
         - 이미지 + 텍스트 → "image_text"
         - 짧은 텍스트만 → "title_only"
         - 긴 텍스트 → "paragraph"
+        
+        analyze_slide_content passes its _scan_markdown result; when omitted
+        the markdown is scanned here (once).
         """
+        if scan is None:
+            scan = _scan_markdown(markdown)
+        bullet_count = scan["bullet"]
+        
         # Check for title-only slides
-        if len(markdown.strip()) < 50 and not self.bullet_pattern.search(markdown):
+        if len(markdown.strip()) < 50 and not bullet_count:
             return "title_only"
         
         # Check for matrix/table
-        if self.table_pattern.search(markdown) or "matrix" in markdown.lower() or "매트릭스" in markdown:
+        if scan["table"] or scan["matrix"] or scan["matrix_ko"]:
             return "matrix"
         
         # Check for comparison
@@ -123,11 +179,10 @@ class ContentAnalyzer:
             return "comparison"
         
         # Check for image with text
-        if self.image_pattern.search(markdown) or self.chart_pattern.search(markdown):
+        if scan["image"] or scan["chart"]:
             return "image_text"
         
         # Check for bullet list
-        bullet_count = len(self.bullet_pattern.findall(markdown))
         if bullet_count >= 3:
             return "list"
         elif bullet_count > 0:
@@ -145,12 +200,13 @@ class ContentAnalyzer:
         - high: > 150 단어
         """
         # Remove markdown syntax for accurate word count
-        clean_text = re.sub(r'[#*\[\]()]', '', text)
+        clean_text = _MD_STRIP_RE.sub('', text)
         
         # Count words (works for both Korean and English)
         # Korean words are counted by spaces and particles
         words = clean_text.split()
-        korean_chars = len(re.findall(r'[\u3131-\ucb4c]', clean_text))
+        codepoints = np.frombuffer(clean_text.encode('utf-32-le'), dtype=np.uint32)
+        korean_chars = int(((codepoints >= _KOREAN_FIRST) & (codepoints <= _KOREAN_LAST)).sum())
         
         # Estimate Korean words (rough estimate: 2-3 chars per word)
         korean_words = korean_chars // 3 if korean_chars > 0 else 0
@@ -178,94 +234,15 @@ class ContentAnalyzer:
     def optimize_content_for_layout(self, content: List[str], layout_type: str) -> List[str]:
         """
         Enhanced content optimization for all layout types
-        """
-        if layout_type == "bullet_list":
-            # Limit to 5 bullets and truncate long items
-            optimized = []
-            for item in content[:5]:
-                if len(item) > 80:
-                    item = item[:77] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "two_column":
-            # Balance content between columns
-            optimized = []
-            for item in content[:8]:  # Max 4 per column
-                if len(item) > 60:
-                    item = item[:57] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "three_column":
-            # Distribute across three columns
-            optimized = []
-            for item in content[:9]:  # Max 3 per column
-                if len(item) > 40:
-                    item = item[:37] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "timeline":
-            # Optimize for timeline milestones
-            optimized = []
-            for item in content[:4]:  # Max 4 milestones
-                if len(item) > 30:
-                    item = item[:27] + "..."
-                optimized.append(item)
-            return optimized
         
-        elif layout_type == "process_flow":
-            # Optimize for process steps
-            optimized = []
-            for item in content[:5]:  # Max 5 steps
-                if len(item) > 40:
-                    item = item[:37] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "pyramid":
-            # Optimize for hierarchy levels
-            optimized = []
-            for item in content[:7]:  # Pyramid structure levels
-                if len(item) > 25:
-                    item = item[:22] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "dashboard_grid":
-            # Optimize for KPI cards
-            optimized = []
-            for item in content[:6]:  # Max 6 KPIs
-                if len(item) > 20:
-                    item = item[:17] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "quote_highlight":
-            # Optimize for quote content
-            if len(content) > 0 and len(content[0]) > 200:
-                return [content[0][:197] + "..."]
-            return content[:1]  # Single quote
-        
-        elif layout_type == "split_screen":
-            # Optimize for balanced panels
-            optimized = []
-            for item in content[:10]:  # Generous limit for panels
-                if len(item) > 300:
-                    item = item[:297] + "..."
-                optimized.append(item)
-            return optimized
-        
-        elif layout_type == "agenda_toc":
-            # Optimize for agenda items
-            optimized = []
-            for item in content[:5]:  # Max 5 agenda items
-                if len(item) > 60:
-                    item = item[:57] + "..."
-                optimized.append(item)
-            return optimized
-        
-        else:
-            # Default optimization
-            return content[:7]  # Reasonable default limit
\ No newline at end of file
+        Item count and per-item length limits come from _LAYOUT_LIMITS.
+        """
+        max_items, max_len = _LAYOUT_LIMITS.get(layout_type, _DEFAULT_LAYOUT_LIMIT)
+        items = content[:max_items]
+        if max_len is None:
+            return items
+        return [item[:max_len - 3] + "..." if len(item) > max_len else item for item in items]
+
+
+# Shared stateless instance
+content_analyzer = ContentAnalyzer()
@@ -8,12 +8,42 @@ Produces a small but valid PPTX deck to ensure files always open.
 
 from __future__ import annotations
 
+import copy
 import logging
-from typing import Dict, Any
+import re
+import threading
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Optional
 
 from pptx import Presentation
 from pptx.util import Inches
 
+# Non-empty physical lines ("\r" and "\n" both end a line)
+_LINE_RE = re.compile(r"[^\r\n]+")
+
+_TEMPLATE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _template_presentation(width: Optional[int], height: Optional[int]) -> Presentation:
+    prs = Presentation()
+    if width is not None:
+        prs.slide_width = width
+    if height is not None:
+        prs.slide_height = height
+    return prs
+
+
+def new_presentation(width: Optional[int] = None, height: Optional[int] = None) -> Presentation:
+    """Return a fresh, empty deck.
+
+    python-pptx's bundled default.pptx is unzipped and parsed once per slide
+    size; every call deep-copies that pristine template instead.
+    """
+    with _TEMPLATE_LOCK:
+        return copy.deepcopy(_template_presentation(width, height))
+
 
 class ContentGenerator:
     """Lightweight, encoding-safe PPT content generator.
@@ -38,7 +68,8 @@ class ContentGenerator:
         - Uses ASCII-safe placeholders where needed
         """
         try:
-            prs = Presentation()
+            prs = new_presentation()
+            body_layout = prs.slide_layouts[1]
 
             # 1) Title slide
             try:
@@ -54,15 +85,11 @@ class ContentGenerator:
 
             # 2) Executive summary slide
             try:
-                slide = prs.slides.add_slide(prs.slide_layouts[1])
+                slide = prs.slides.add_slide(body_layout)
                 title = slide.shapes.title
                 if title:
                     title.text = "Executive Summary"
-                body = None
-                for ph in slide.placeholders:
-                    if ph.has_text_frame and ph != title:
-                        body = ph
-                        break
+                body = _body_placeholder(slide, title)
                 summary = (document or "").strip()
                 if not summary:
                     summary = "No document content provided."
@@ -75,15 +102,11 @@ class ContentGenerator:
 
             # 3) Content slide
             try:
-                slide = prs.slides.add_slide(prs.slide_layouts[1])
+                slide = prs.slides.add_slide(body_layout)
                 title = slide.shapes.title
                 if title:
                     title.text = "Key Points"
-                body = None
-                for ph in slide.placeholders:
-                    if ph.has_text_frame and ph != title:
-                        body = ph
-                        break
+                body = _body_placeholder(slide, title)
                 if body and body.has_text_frame:
                     tf = body.text_frame
                     tf.clear()
@@ -121,13 +144,16 @@ class ContentGenerator:
             return prs
 
 
+def _body_placeholder(slide, title):
+    """First text placeholder other than the title (shape proxies compare by element)."""
+    return next((ph for ph in slide.placeholders if ph.has_text_frame and ph != title), None)
+
+
 def _extract_bullets(text: str) -> list[str]:
     try:
-        t = (text or "").replace("\r", "\n")
-        lines = [ln.strip(" -•\t") for ln in t.split("\n")]
-        lines = [ln for ln in lines if ln]
-        # Take first 6 non-empty lines as bullets
-        return lines[:6]
+        # Lazily strip lines and stop after the first 6 non-empty ones
+        lines = (m.group().strip(" -•\t") for m in _LINE_RE.finditer(text or ""))
+        return list(islice(filter(None, lines), 6))
     except Exception:
         return []
 
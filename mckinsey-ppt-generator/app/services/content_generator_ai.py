@@ -7,24 +7,147 @@ imports so it works in constrained environments.
 """
 
 import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
 from typing import List, Dict
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
+from pptx.slide import SlideLayout
 from app.services.simple_chart_generator import SimpleChartGenerator
+from app.services.content_generator import new_presentation
+
+# Faster JSON decoding for LLM responses when orjson is installed (optional)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional slide helpers: resolved once at import, skipped when unavailable
+try:
+    from app.services.layout_validator import LayoutValidator
+except Exception:
+    LayoutValidator = None  # type: ignore
+try:
+    from app.services.template_orchestrator import TemplateOrchestrator
+except Exception:
+    TemplateOrchestrator = None  # type: ignore
+
+# Upper bound on in-flight OpenAI calls per generator (keeps bursts under RPM limits)
+MAX_CONCURRENT_LLM_CALLS = 8
+# Most recent LLM responses kept per generator for de-duplicating identical instructions
+RESPONSE_CACHE_SIZE = 256
+
+# OpenAI Batch API polling (offline decks only; batches may take up to 24h)
+BATCH_POLL_INTERVAL = 30.0
+BATCH_MAX_WAIT = 24 * 3600.0
+_BATCH_TERMINAL_STATES = ('completed', 'failed', 'expired', 'cancelled')
+
+# (model, max_tokens) per slide: title/generic content slides only need the small
+# JSON schema filled in, analysis slides (matrix, options, ...) keep the full model
+_FULL_MODEL = ("gpt-4-turbo-preview", 900)
+_LIGHT_MODEL = ("gpt-4o-mini", 500)
+_LIGHT_SLIDE_TYPES = frozenset({'title', 'content'})
+
+# enriched_content keys passed through to the template spec as-is
+_SPEC_KEYS = frozenset({
+    'columns', 'matrix', 'left', 'right', 'pros', 'cons', 'before', 'after',
+    'milestones', 'kpis', 'chart_data', 'chart_title',
+})
+
+# Korean display titles for the strategist's standard slide types
+_KO_TITLE_MAP = {
+    'Title': '표지',
+    'Executive Summary': '핵심 요약',
+    'Market Analysis': '시장 분석',
+    'Strategic Options': '전략 옵션',
+    'Recommendations': '권고안',
+    'Internal Analysis': '내부 분석',
+    'Impact Analysis': '영향 분석',
+    'Challenges': '과제',
+}
+
+# Title keywords (matched against the lowercased slide title) that pick a layout intent
+_MARKET_RE = re.compile(r"market|고객|시장")
+_MATRIX_RE = re.compile(r"strategic options|matrix|impact|매트릭스|전략")
+
+
+# One AsyncOpenAI client shared by all generators on the same event loop, so warm
+# requests reuse pooled keep-alive connections instead of a new TCP/TLS handshake.
+_LLM_POOL_LIMITS = {'max_connections': 64, 'max_keepalive_connections': 32}
+_llm_client_state = None  # (client, event loop, api key)
+
+
+def _shared_llm_client(api_key: str):
+    global _llm_client_state
+    import httpx
+    from openai import AsyncOpenAI  # type: ignore
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    state = _llm_client_state
+    if loop is not None and state is not None and state[1] is loop and state[2] == api_key:
+        return state[0]
+    try:
+        import h2  # noqa: F401  (HTTP/2 multiplexing only when the optional h2 package exists)
+        http2 = True
+    except ImportError:
+        http2 = False
+    client = AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(**_LLM_POOL_LIMITS),
+            timeout=httpx.Timeout(60.0),
+            follow_redirects=True,
+        ),
+    )
+    # httpx connection pools are bound to the loop that opened them; outside a
+    # running loop the client is not shared
+    if loop is not None:
+        _llm_client_state = (client, loop, api_key)
+    return client
 
 
 class ContentGeneratorAI:
+    _LANG_MESSAGES = {
+        'ko': '모든 출력을 한국어로 작성하세요. 제목과 불릿포인트, 본문 모두 한국어로 작성.',
+        'en': 'Write all output in English. Title, bullets, and body in English.',
+        'ja': 'すべて日本語で出力してください。タイトルや箇条書き、本文は日本語で。',
+    }
+    _INSTRUCTION_TEMPLATE = (
+        "Slide: {title}\n\n"
+        "{lang_msg}\n"
+        "Create McKinsey-style slide content. Respond with JSON only.\n"
+        "Fields: headline (1-2 sentences), key_points (3-5), supporting_detail.\n\n"
+        "Source:\n{source}\n\n"
+        "Data insights:\n{insights}\n\n"
+        "Strategy recommendations:\n{strategies}\n\n"
+        "Industry context:\n{industry_context}\n"
+    )
+
     def __init__(self, language: str = "ko") -> None:
         self.language = language
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+        # blake2b(model + instruction) -> LLM task; identical instructions (e.g. cycled
+        # section titles) share one request, including while it is in flight;
+        # least recently used entries are dropped beyond RESPONSE_CACHE_SIZE
+        self._cache: "OrderedDict[bytes, asyncio.Future]" = OrderedDict()
+        # Stateless slide helpers shared by every content slide
+        self._validator = LayoutValidator() if LayoutValidator else None
+        self._orch = TemplateOrchestrator() if TemplateOrchestrator else None
+        # (StrategistAgent, DataAnalystAgent), created on first document and reused
+        self._agents = None
         try:
             import os
-            if os.getenv("OPENAI_API_KEY"):
-                from openai import AsyncOpenAI  # type: ignore
-                self.llm = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-            else:
-                self.llm = None
+            api_key = os.getenv("OPENAI_API_KEY")
+            self.llm = _shared_llm_client(api_key) if api_key else None
         except Exception:
             self.llm = None
         try:
@@ -32,17 +155,16 @@ class ContentGeneratorAI:
             self._formatter = EumsumStyleConverter()
         except Exception:
             self._formatter = None
+        # Only Korean output is converted to 음슴체; decided once per generator
+        self._needs_format = bool(self._formatter) and (self.language or 'ko').lower().startswith('ko')
 
-    async def generate_from_document_with_ai(self, document: str, num_slides: int = 6, target_audience: str = "executive") -> Presentation:
+    async def generate_from_document_with_ai(self, document: str, num_slides: int = 6, target_audience: str = "executive", batch: bool = False) -> Presentation:
         # Optional agent-based enrichment
         sections = []
         data_insights_seed = []
         strategies_seed = []
         try:
-            from app.agents.strategist_agent import StrategistAgent
-            from app.agents.data_analyst_agent import DataAnalystAgent
-            strat = StrategistAgent()
-            analyst = DataAnalystAgent()
+            strat, analyst = self._ensure_agents()
             sres = await strat.process(input_data={'document': document, 'num_slides': num_slides}, context={'language': self.language})
             ares = await analyst.process(input_data={'document': document, 'outline': sres.get('outline', []), 'pyramid': sres.get('pyramid', {})}, context={'language': self.language})
             sections = [item.get('title','Section') for item in (sres.get('outline') or []) if isinstance(item, dict) and item.get('title')]
@@ -58,20 +180,10 @@ class ContentGeneratorAI:
         if slide_outline:
             slides: List[Dict] = []
             # Localize title for display if needed
-            def _localize(title: str) -> str:
-                if (self.language or 'ko').lower().startswith('ko'):
-                    m = {
-                        'Title': '표지',
-                        'Executive Summary': '핵심 요약',
-                        'Market Analysis': '시장 분석',
-                        'Strategic Options': '전략 옵션',
-                        'Recommendations': '권고안',
-                        'Internal Analysis': '내부 분석',
-                        'Impact Analysis': '영향 분석',
-                        'Challenges': '과제',
-                    }
-                    return m.get(title, title)
-                return title
+            if (self.language or 'ko').lower().startswith('ko'):
+                _localize = lambda title: _KO_TITLE_MAP.get(title, title)
+            else:
+                _localize = lambda title: title
 
             slides.append({
                 'slide_number': 0,
@@ -105,7 +217,7 @@ class ContentGeneratorAI:
                         industry_context=extra,
                     )
                 })
-            return await self.generate_slides_with_ai(slides)
+            return await self.generate_slides_with_ai(slides, batch=batch)
         if not sections:
             sections = [
                 "Executive Summary",
@@ -116,13 +228,7 @@ class ContentGeneratorAI:
         # 요청 슬라이드 수를 존중: 제목(1) + 본문(num_slides-1)
         desired = max(1, num_slides - 1)
         # 섹션명을 순환하여 원하는 개수 채우기
-        seq: List[str] = []
-        while len(seq) < desired:
-            for s in sections:
-                if len(seq) < desired:
-                    seq.append(s)
-                else:
-                    break
+        seq: List[str] = (list(sections) * -(-desired // len(sections)))[:desired]
 
         slides: List[Dict] = []
         slides.append({
@@ -146,20 +252,25 @@ class ContentGeneratorAI:
             )
         })
 
+        # normalize insights/strategies once; lowercase copies are matched per section
+        norm_ins = []
+        for it in (data_insights_seed if isinstance(data_insights_seed, list) else []):
+            try:
+                s = it.get('insight') if isinstance(it, dict) else str(it)
+            except Exception:
+                s = str(it)
+            norm_ins.append(s)
+        ins_lower = [(s, s.lower()) for s in norm_ins]
+        strat_list = strategies_seed if isinstance(strategies_seed, list) else [str(strategies_seed)]
+        strat_lower = [(s, str(s).lower()) for s in strat_list]
+
         for i, title in enumerate(seq):
-            title_keys = set([w.lower() for w in title.split() if w])
-            # normalize insights
-            norm_ins = []
-            for it in (data_insights_seed if isinstance(data_insights_seed, list) else []):
-                try:
-                    s = it.get('insight') if isinstance(it, dict) else str(it)
-                except Exception:
-                    s = str(it)
-                norm_ins.append(s)
-            picked_ins = [s for s in norm_ins if any(k in s.lower() for k in title_keys)] or norm_ins[:2]
-            # strategies
-            strat_list = strategies_seed if isinstance(strategies_seed, list) else [str(strategies_seed)]
-            picked_strat = [s for s in strat_list if any(k in str(s).lower() for k in title_keys)] or strat_list[:2]
+            # substring match on any title word (kept as substring, not token, match so
+            # Korean words with attached particles - e.g. '시장은' - still match '시장')
+            title_keys = sorted({w.lower() for w in title.split() if w})
+            key_re = re.compile('|'.join(map(re.escape, title_keys))) if title_keys else None
+            picked_ins = [s for s, low in ins_lower if key_re and key_re.search(low)] or norm_ins[:2]
+            picked_strat = [s for s, low in strat_lower if key_re and key_re.search(low)] or strat_list[:2]
 
             slides.append({
                 'slide_number': i + 1,
@@ -182,45 +293,198 @@ class ContentGeneratorAI:
                 )
             })
 
-        return await self.generate_slides_with_ai(slides)
+        return await self.generate_slides_with_ai(slides, batch=batch)
 
-    async def generate_slides_with_ai(self, integrated_insights: List[Dict]) -> Presentation:
-        prs = Presentation()
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
+    def _ensure_agents(self):
+        if self._agents is None:
+            from app.agents.strategist_agent import StrategistAgent
+            from app.agents.data_analyst_agent import DataAnalystAgent
+            self._agents = (StrategistAgent(), DataAnalystAgent())
+        return self._agents
 
-        for idx, slide_data in enumerate(integrated_insights):
-            content = await self._generate_content(slide_data)
-            if idx == 0:
-                self._add_title_slide(prs, content)
-            else:
-                self._add_content_slide(prs, slide_data, content)
+    async def generate_slides_with_ai(self, integrated_insights: List[Dict], batch: bool = False) -> Presentation:
+        if batch:
+            return await self.generate_slides_with_ai_batch(integrated_insights)
+
+        # LLM round-trips run concurrently. Slides are appended in order as soon as
+        # they and every earlier slide have content, so rendering overlaps the
+        # remaining requests; python-pptx/lxml work runs off the event loop, one
+        # slide at a time (python-pptx objects are not shared across threads).
+        loop = asyncio.get_running_loop()
+        tasks = [asyncio.ensure_future(self._generate_content(slide_data)) for slide_data in integrated_insights]
+        try:
+            prs, blank = await loop.run_in_executor(None, self._new_presentation)
+            for idx, (slide_data, task) in enumerate(zip(integrated_insights, tasks)):
+                try:
+                    content = await task
+                except Exception as exc:
+                    content = exc
+                await loop.run_in_executor(None, self._render_slide, prs, blank, idx, slide_data, content)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return prs
+
+    async def generate_slides_with_ai_batch(self, integrated_insights: List[Dict], poll_interval: float = BATCH_POLL_INTERVAL, max_wait: float = BATCH_MAX_WAIT) -> Presentation:
+        """Offline variant: one OpenAI Batch API job for the whole deck (half price, no RPM pressure).
+
+        Slides whose batch line is missing or failed - or every slide, if the job
+        cannot be submitted or does not finish within max_wait - use fallback content.
+        """
+        if self.llm is not None and getattr(self.llm, 'batches', None) is None:
+            # openai releases before Batch API support: use the live path rather
+            # than failing the upload and falling back for every slide
+            return await self.generate_slides_with_ai(integrated_insights)
+        responses: Dict[str, Dict] = {}
+        if self.llm and integrated_insights:
+            try:
+                responses = await self._run_batch(integrated_insights, poll_interval, max_wait)
+            except Exception:
+                responses = {}
+        contents = [
+            self._post_process(responses[f"slide_{i}"]) if f"slide_{i}" in responses
+            else self._post_process(self._fallback(slide_data))
+            for i, slide_data in enumerate(integrated_insights)
+        ]
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._build_presentation, integrated_insights, contents)
+
+    async def _run_batch(self, integrated_insights: List[Dict], poll_interval: float, max_wait: float) -> Dict[str, Dict]:
+        lines = [
+            json.dumps({
+                "custom_id": f"slide_{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._completion_body(slide_data.get('generation_instruction', ''), *self._select_model(slide_data)),
+            }, ensure_ascii=False)
+            for i, slide_data in enumerate(integrated_insights)
+        ]
+        upload = await self.llm.files.create(
+            file=("slides.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        # Uploaded input and job output/error files are deleted once the job is
+        # done with so they do not accumulate in the account
+        file_ids = [upload.id]
+        try:
+            job = await self.llm.batches.create(
+                input_file_id=upload.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            deadline = time.monotonic() + max_wait
+            while job.status not in _BATCH_TERMINAL_STATES:
+                if time.monotonic() >= deadline:
+                    await self.llm.batches.cancel(job.id)
+                    return {}
+                await asyncio.sleep(poll_interval)
+                job = await self.llm.batches.retrieve(job.id)
+            file_ids += [job.output_file_id, job.error_file_id]
+            if job.status != 'completed' or not job.output_file_id:
+                return {}
+
+            output = await self.llm.files.content(job.output_file_id)
+        finally:
+            await asyncio.gather(
+                *(self.llm.files.delete(file_id) for file_id in file_ids if file_id),
+                return_exceptions=True,
+            )
+        responses: Dict[str, Dict] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                item = _loads(line)
+                response = item.get('response') or {}
+                if response.get('status_code') != 200:
+                    continue
+                message = response['body']['choices'][0]['message']['content']
+                responses[item['custom_id']] = _loads((message or '').strip())
+            except Exception:
+                continue
+        return responses
+
+    def _new_presentation(self):
+        prs = new_presentation(Inches(10), Inches(7.5))
+        # Resolve the blank layout once per deck instead of once per slide
+        layouts = prs.slide_layouts
+        blank = layouts[6] if len(layouts) > 6 else layouts[0]
+        return prs, blank
+
+    def _render_slide(self, prs: Presentation, blank: SlideLayout, idx: int, slide_data: Dict, content) -> None:
+        if isinstance(content, BaseException):
+            content = self._post_process(self._fallback(slide_data))
+        if idx == 0:
+            self._add_title_slide(prs, blank, content)
+        else:
+            self._add_content_slide(prs, blank, slide_data, content)
+
+    def _build_presentation(self, integrated_insights: List[Dict], contents: List) -> Presentation:
+        prs, blank = self._new_presentation()
+        for idx, (slide_data, content) in enumerate(zip(integrated_insights, contents)):
+            self._render_slide(prs, blank, idx, slide_data, content)
         return prs
 
     async def _generate_content(self, slide_data: Dict) -> Dict:
         instruction = slide_data.get('generation_instruction', '')
         if not self.llm:
             return self._post_process(self._fallback(slide_data))
+        model, max_tokens = self._select_model(slide_data)
+        key = hashlib.blake2b(f"{model}\0{instruction}".encode('utf-8'), digest_size=16).digest()
+        task = self._cache.get(key)
+        if task is None or task.cancelled():
+            task = self._cache[key] = asyncio.ensure_future(self._request_content(instruction, model, max_tokens))
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                # An evicted in-flight task keeps running for its current awaiters
+                self._cache.popitem(last=False)
+        self._cache.move_to_end(key)
         try:
-            resp = await asyncio.wait_for(
-                self.llm.chat.completions.create(
-                    model="gpt-4-turbo-preview",
-                    messages=[
-                        {"role": "system", "content": self._system_instruction_json_only()},
-                        {"role": "user", "content": instruction},
-                    ],
-                    temperature=0.7,
-                    max_tokens=900,
-                    response_format={"type": "json_object"},
-                ),
-                timeout=60,
-            )
-            import json
-            data = json.loads((resp.choices[0].message.content or '').strip())
-            return self._post_process(data)
+            return dict(await task)
         except Exception:
+            # Failures are not cached so a later slide/deck can retry
+            if self._cache.get(key) is task:
+                del self._cache[key]
             return self._post_process(self._fallback(slide_data))
 
+    async def _request_content(self, instruction: str, model: str, max_tokens: int) -> Dict:
+        async with self._sem:
+            raw = await asyncio.wait_for(
+                self._stream_completion(self._completion_body(instruction, model, max_tokens)),
+                timeout=60,
+            )
+        data = _loads(raw.strip())
+        return self._post_process(data)
+
+    async def _stream_completion(self, body: Dict) -> str:
+        """Stream a chat completion and return the concatenated message text"""
+        stream = await self.llm.chat.completions.create(**body, stream=True)
+        parts: List[str] = []
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+        return ''.join(parts)
+
+    @staticmethod
+    def _select_model(slide_data: Dict):
+        """(model, max_tokens) for a slide, routed by its type"""
+        stype = (slide_data.get('type') or '').lower()
+        return _LIGHT_MODEL if stype in _LIGHT_SLIDE_TYPES else _FULL_MODEL
+
+    def _completion_body(self, instruction: str, model: str = _FULL_MODEL[0], max_tokens: int = _FULL_MODEL[1]) -> Dict:
+        """Chat completion parameters shared by the live and Batch API paths"""
+        return {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": self._system_instruction_json_only()},
+                {"role": "user", "content": instruction},
+            ],
+            "temperature": 0.7,
+            "max_tokens": max_tokens,
+            "response_format": {"type": "json_object"},
+        }
+
     def _fallback(self, slide_data: Dict) -> Dict:
         enriched = slide_data.get('enriched_content', {}) or {}
         title = slide_data.get('title', 'Slide')
@@ -248,18 +512,18 @@ class ContentGeneratorAI:
         }
 
     def _post_process(self, data: Dict) -> Dict:
-        if (getattr(self, 'language', 'ko') or "").lower().startswith("ko") and getattr(self, '_formatter', None):
-            try:
-                if 'headline' in data:
-                    data['headline'] = self._formatter.convert_headline(str(data.get('headline') or ''))
-                if 'key_points' in data and isinstance(data.get('key_points'), list):
-                    data['key_points'] = self._formatter.convert_bullet_points([str(x) for x in data['key_points']])
-            except Exception:
-                pass
+        if not self._needs_format:
+            return data
+        try:
+            if 'headline' in data:
+                data['headline'] = self._formatter.convert_headline(str(data.get('headline') or ''))
+            if 'key_points' in data and isinstance(data.get('key_points'), list):
+                data['key_points'] = self._formatter.convert_bullet_points([str(x) for x in data['key_points']])
+        except Exception:
+            pass
         return data
 
-    def _add_title_slide(self, prs: Presentation, content: Dict) -> None:
-        blank = prs.slide_layouts[6 if len(prs.slide_layouts) > 6 else 0]
+    def _add_title_slide(self, prs: Presentation, blank: SlideLayout, content: Dict) -> None:
         slide = prs.slides.add_slide(blank)
         tbox = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1.5))
         tf = tbox.text_frame
@@ -292,8 +556,7 @@ class ContentGeneratorAI:
                 p.font.size = Pt(14)
                 p.font.color.rgb = RGBColor(83, 86, 90)
 
-    def _add_content_slide(self, prs: Presentation, slide_data: Dict, content: Dict) -> None:
-        blank = prs.slide_layouts[6 if len(prs.slide_layouts) > 6 else 0]
+    def _add_content_slide(self, prs: Presentation, blank: SlideLayout, slide_data: Dict, content: Dict) -> None:
         slide = prs.slides.add_slide(blank)
         # Build spec and normalize
         title_lower = (slide_data.get('title', '') or '').lower()
@@ -313,37 +576,33 @@ class ContentGeneratorAI:
                 return []
             k = max(1, (n + 2) // 3)
             return [items[:k], items[k:2*k], items[2*k:]]
-        if any(key in title_lower for key in ['market analysis','market','고객','시장']) and bullets:
+        if bullets and _MARKET_RE.search(title_lower):
             spec['columns'] = split_three_columns(bullets)
-        if any(key in title_lower for key in ['strategic options','matrix','impact','매트릭스','전략']) and bullets:
+        if bullets and _MATRIX_RE.search(title_lower):
             # Create a simple 2x2 matrix from bullets
             m = [["", ""], ["", ""]]
             for i, it in enumerate(bullets[:4]):
                 m[i//2][i%2] = str(it)
             spec['matrix'] = m
         ec = slide_data.get('enriched_content') or {}
-        for k in ('columns','matrix','left','right','pros','cons','before','after','milestones','kpis','chart_data','chart_title'):
-            if k in ec:
-                spec[k] = ec.get(k)
+        for k, v in ec.items():
+            if k in _SPEC_KEYS:
+                spec[k] = v
         if slide_data.get('layout_type'):
             spec['layout_type'] = slide_data.get('layout_type')
         if slide_data.get('content_type'):
             spec['content_type'] = slide_data.get('content_type')
-        if isinstance(ec.get('columns'), list):
-            spec['columns'] = ec.get('columns')
-        if isinstance(ec.get('matrix'), list):
-            spec['matrix'] = ec.get('matrix')
-        try:
-            from app.services.layout_validator import LayoutValidator
-            spec = LayoutValidator().normalize(spec)
-        except Exception:
-            pass
-        try:
-            from app.services.template_orchestrator import TemplateOrchestrator
-            TemplateOrchestrator().select_and_apply(slide, spec)
-            return
-        except Exception:
-            pass
+        if self._validator is not None:
+            try:
+                spec = self._validator.normalize(spec)
+            except Exception:
+                pass
+        if self._orch is not None:
+            try:
+                self._orch.select_and_apply(slide, spec)
+                return
+            except Exception:
+                pass
         # Fallback simple rendering
         tb = slide.shapes.add_textbox(Inches(0.5), Inches(0.5), Inches(9), Inches(0.7))
         tf = tb.text_frame; tf.text = slide_data.get('title', ''); tf.word_wrap = True
@@ -351,28 +610,25 @@ class ContentGeneratorAI:
         hf = hb.text_frame; hf.text = content.get('headline', ''); hf.word_wrap = True
         pb = slide.shapes.add_textbox(Inches(0.5), Inches(2.2), Inches(9), Inches(4))
         ptf = pb.text_frame; ptf.word_wrap = True
-        for i, point in enumerate(content.get('key_points') or []):
-            p = ptf.paragraphs[0] if i == 0 else ptf.add_paragraph(); p.text = f"• {point}"
+        # Build <a:p> runs directly on the txBody element (no _Paragraph proxy per bullet);
+        # append_text keeps python-pptx's line-break/control-character handling.
+        points = content.get('key_points') or []
+        if points:
+            txBody = ptf._txBody
+            txBody.p_lst[0].append_text(f"• {points[0]}")  # new textbox starts with one empty <a:p/>
+            for point in points[1:]:
+                txBody.add_p().append_text(f"• {point}")
 
     def _make_instruction(self, title: str, source: str, data_insights: List, strategies: List, industry_context: str) -> str:
         lang = (getattr(self, 'language', 'ko') or 'ko').lower()
-        lang_msg = {
-            'ko': '모든 출력을 한국어로 작성하세요. 제목과 불릿포인트, 본문 모두 한국어로 작성.',
-            'en': 'Write all output in English. Title, bullets, and body in English.',
-            'ja': 'すべて日本語で出力してください。タイトルや箇条書き、本文は日本語で。',
-        }.get(lang, 'Write all output in the specified language.')
-        fi = "\n".join([f"- {str(x)[:200]}" for x in data_insights]) or "(none)"
-        fs = "\n".join([f"- {str(x)[:200]}" for x in strategies]) or "(none)"
-        return (
-            f"Slide: {title}\n\n"
-            f"{lang_msg}\n"
-            "Create McKinsey-style slide content. Respond with JSON only.\n"
-            "Fields: headline (1-2 sentences), key_points (3-5), supporting_detail.\n\n"
-            f"Source:\n{source[:800]}\n\n"
-            f"Data insights:\n{fi}\n\n"
-            f"Strategy recommendations:\n{fs}\n\n"
-            f"Industry context:\n{(industry_context or '')[:400]}\n"
-        )
+        return self._INSTRUCTION_TEMPLATE.format_map({
+            'title': title,
+            'lang_msg': self._LANG_MESSAGES.get(lang, 'Write all output in the specified language.'),
+            'source': source[:800],
+            'insights': "\n".join(f"- {str(x)[:200]}" for x in data_insights) or "(none)",
+            'strategies': "\n".join(f"- {str(x)[:200]}" for x in strategies) or "(none)",
+            'industry_context': (industry_context or '')[:400],
+        })
 
     def _system_instruction_json_only(self) -> str:
         lang = (getattr(self, 'language', 'ko') or 'ko').lower()
@@ -7,13 +7,77 @@ Applies a clean McKinsey-like style to a presentation:
 - Basic typography (Arial): title/body sizes and colors
 """
 
+import bisect
+from copy import deepcopy
 import logging
+from operator import itemgetter
+from types import MappingProxyType
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
+from lxml import etree
+from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 
 logger = logging.getLogger(__name__)
 
+# 타이틀 길이 상한 -> 폰트 크기 (import 시 한 번만 생성)
+_TITLE_LIMITS = [30, 50, 80]
+_TITLE_SIZES = [Pt(28), Pt(24), Pt(20), Pt(18)]
+
+# slide_type -> 레이아웃 이름 (_select_layout 조회용, 읽기 전용)
+_LAYOUT_MAPPING = MappingProxyType({
+    "title": "title_slide",
+    "executive_summary": "dual_header",
+    "market_analysis": "three_column",
+    "strategy": "matrix",
+    "financial": "waterfall",
+    "conclusion": "title_slide",
+})
+
+# 마스터에 한 번만 넣는 슬라이드 번호 필드 (PowerPoint가 슬라이드별로 자동 채움)
+_SLIDE_NUMBER_SHAPE_NAME = "McKinsey Slide Number"
+_SLIDE_NUMBER_FIELD = (
+    '<a:fld %s id="{B6F15528-21DE-4FAA-801E-634DDDAF4B2B}" type="slidenum">'
+    '<a:rPr lang="en-US" sz="1000"><a:solidFill><a:srgbClr val="53565A"/></a:solidFill>'
+    '<a:latin typeface="Arial"/></a:rPr><a:t>‹#›</a:t></a:fld>' % nsdecls('a')
+)
+
+# 런 rPr을 통째로 교체해도 잃을 것이 없는 자식 요소 (채우기/라틴 폰트는 어차피 덮어씀)
+_REPLACEABLE_RPR_CHILDREN = frozenset(
+    qn(tag) for tag in (
+        "a:noFill", "a:solidFill", "a:gradFill", "a:blipFill", "a:pattFill", "a:grpFill", "a:latin",
+    )
+)
+
+_A_T = qn("a:t")
+
+# 마스터 bodyStyle을 그대로 상속받는 본문 placeholder 유형
+_BODY_PLACEHOLDER_TYPES = frozenset((PP_PLACEHOLDER.BODY, PP_PLACEHOLDER.OBJECT))
+# 레이아웃/마스터 placeholder lstStyle 중 상속 결과를 바꾸는 재정의
+_LST_STYLE_OVERRIDES = (
+    "./a:lstStyle//a:defRPr[@sz or @b] | ./a:lstStyle//a:defRPr/a:solidFill"
+    " | ./a:lstStyle//a:defRPr/a:latin | ./a:lstStyle//a:lnSpc"
+)
+
+
+def _has_text(shape) -> bool:
+    """<a:t> 요소만 훑어 공백 아닌 텍스트가 있는지 확인 (text_frame.text 문자열 결합 생략)"""
+    return any((t.text or "").strip() for t in shape._element.iter(_A_T))
+
+
+# 스키마상 latin 뒤에 오는 defRPr 자식 (템플릿 뒤에 그대로 붙여도 순서 유지)
+_DEF_RPR_TRAILING_CHILDREN = frozenset(
+    qn(tag) for tag in ("a:ea", "a:cs", "a:sym", "a:hlinkClick", "a:hlinkMouseOver", "a:rtl", "a:extLst")
+)
+
+# 한국어 글리프 우선 폰트 폴백 체인
+_FALLBACK_CHAIN = ('Noto Sans CJK KR', 'Noto Sans KR', 'NanumGothic', '맑은 고딕', 'Arial')
+# python-pptx는 font.name 대입 시 예외를 던지지 않으므로 체인의 첫 후보가 항상 채택됨
+_CJK_FONT = _FALLBACK_CHAIN[0]
+
 
 class DesignApplicator:
     COLORS = {
@@ -32,21 +96,35 @@ class DesignApplicator:
         "line_spacing": 1.2,
     }
 
+    # Slide type -> layout name mapping (for future layout engines)
+    SLIDE_TYPE_LAYOUTS = MappingProxyType({
+        "Title": "title_slide",
+        "Executive Summary": "dual_header",
+        "Market Analysis": "three_column",
+        "Strategic Options": "matrix",
+        "Recommendations": "action_list",
+        "Internal Analysis": "dual_header",
+        "Challenges": "problem_list",
+        "Impact Analysis": "waterfall",
+    })
+
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
         self.stats = {"slides_processed": 0}
-        # Slide type -> layout name mapping (for future layout engines)
-        self.SLIDE_TYPE_LAYOUTS = {
-            "Title": "title_slide",
-            "Executive Summary": "dual_header",
-            "Market Analysis": "three_column",
-            "Strategic Options": "matrix",
-            "Recommendations": "action_list",
-            "Internal Analysis": "dual_header",
-            "Challenges": "problem_list",
-            "Impact Analysis": "waterfall",
+        # title/body 런 스타일을 미리 만든 <a:rPr> 템플릿 (런마다 속성 4번 대신 요소 1번 교체)
+        self._rpr_templates = {
+            "title": self._build_rpr_template(self.MCKINSEY_FONTS["title"], self.COLORS["blue"], _CJK_FONT),
+            "body": self._build_rpr_template(self.MCKINSEY_FONTS["body"], self.COLORS["gray"], _CJK_FONT),
         }
 
+    @staticmethod
+    def _build_rpr_template(font_cfg: dict, color: RGBColor, font_name: str):
+        return parse_xml(
+            '<a:rPr %s sz="%d" b="%d"><a:solidFill><a:srgbClr val="%s"/></a:solidFill>'
+            '<a:latin typeface="%s"/></a:rPr>'
+            % (nsdecls("a"), round(font_cfg["size"].pt * 100), 1 if font_cfg["bold"] else 0, color, font_name)
+        )
+
     def _get_layout(self, prs, layout_name: str):
         # Placeholder: in this styling-only applicator we simply return blank
         return prs.slide_layouts[6 if len(prs.slide_layouts) > 6 else 0]
@@ -65,40 +143,44 @@ class DesignApplicator:
         This method is a no-op shim for compatibility with callers that expect
         a layout decision step before visual styling.
         """
-        try:
-            logger.info(f"Selecting layout for slide_type: {slide_type}")
-            layout_mapping = {
-                "title": "title_slide",
-                "executive_summary": "dual_header",
-                "market_analysis": "three_column",
-                "strategy": "matrix",
-                "financial": "waterfall",
-                "conclusion": "title_slide",
-            }
-            layout_name = layout_mapping.get(slide_type, "dual_header")
-            logger.info(f"Layout selected: {layout_name}")
-            return layout_name
-        except Exception as e:
-            logger.warning(f"Layout selection failed: {e}; falling back to dual_header")
-            return "dual_header"
+        layout_name = _LAYOUT_MAPPING.get(slide_type, "dual_header")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Layout selected for slide_type {slide_type}: {layout_name}")
+        return layout_name
 
     async def apply(self, presentation):
+        # 호출부 호환용 awaitable 래퍼 (내부에는 await 지점이 없음)
+        return self.apply_sync(presentation)
+
+    def apply_sync(self, presentation):
         logger.info(f"Applying McKinsey style to {len(presentation.slides)} slides")
+        # 마스터 번호 필드를 못 넣으면 슬라이드별 텍스트박스로 폴백
+        per_slide_numbers = not self._add_master_slide_number(presentation)
+        # 마스터/테마에 한 번 스타일을 넣어 두면 상속만으로 충분한 본문 런은 건너뜀
+        styled_master = self._apply_master_text_styles(presentation)
         for idx, slide in enumerate(presentation.slides):
-            await self.apply_mckinsey_style_to_slide(slide, idx, is_title_slide=(idx == 0))
+            self.apply_mckinsey_style_to_slide(
+                slide, idx, is_title_slide=(idx == 0), add_number=per_slide_numbers,
+                styled_master=styled_master,
+            )
         return presentation
 
-    async def apply_mckinsey_style_to_slide(self, slide, slide_idx: int, is_title_slide: bool = False):
+    def apply_mckinsey_style_to_slide(
+        self, slide, slide_idx: int, is_title_slide: bool = False, add_number: bool = True,
+        styled_master=None,
+    ):
         self._set_background(slide)
-        if not is_title_slide and slide_idx > 0:
+        if is_title_slide:
+            self._hide_master_shapes(slide)
+        elif add_number and slide_idx > 0:
             self._add_slide_number(slide, slide_idx)
 
         for shape in slide.shapes:
-            if hasattr(shape, "text_frame"):
-                await self._apply_text_style(shape, is_title_slide)
+            if shape.has_text_frame:
+                self._apply_text_style(shape, is_title_slide, styled_master)
 
         if is_title_slide:
-            await self._apply_title_slide_style_improved(slide)
+            self._apply_title_slide_style_improved(slide)
 
         self.stats["slides_processed"] += 1
 
@@ -110,6 +192,129 @@ class DesignApplicator:
         except Exception as e:
             logger.debug(f"Could not set background: {e}")
 
+    def _add_master_slide_number(self, presentation) -> bool:
+        """슬라이드 마스터에 번호 필드를 한 번만 추가 (이미 있으면 재사용)"""
+        try:
+            master = presentation.slide_masters[0]
+            if not any(sh.name == _SLIDE_NUMBER_SHAPE_NAME for sh in master.shapes):
+                # MasterShapes는 읽기 전용이라 spTree XML에 직접 텍스트박스를 추가
+                # (max_shape_id는 sldLayoutId까지 포함하므로 cNvPr id만 기준으로 사용)
+                sp_tree = master.shapes._spTree
+                shape_id = max((int(i) for i in sp_tree.xpath(".//p:cNvPr/@id")), default=1) + 1
+                sp = sp_tree.add_textbox(
+                    shape_id, _SLIDE_NUMBER_SHAPE_NAME,
+                    Inches(12.0), Inches(7.0), Inches(0.8), Inches(0.3),
+                )
+                p = sp.txBody.p_lst[0]
+                p.get_or_add_pPr().set("algn", "r")
+                p.append(parse_xml(_SLIDE_NUMBER_FIELD))
+            # 슬라이드별 텍스트박스와 같은 번호(타이틀 다음 슬라이드가 1)가 되도록 0부터 시작
+            presentation.part._element.set("firstSlideNum", "0")
+            return True
+        except Exception as e:
+            logger.debug(f"Could not add master slide number: {e}")
+            return False
+
+    def _apply_master_text_styles(self, presentation):
+        """슬라이드 마스터 txStyles와 테마 폰트에 McKinsey 스타일을 한 번 적용.
+
+        성공하면 스타일을 넣은 마스터 요소를, 실패하면 None을 반환한다.
+        """
+        try:
+            master = presentation.slide_masters[0]
+            tx_styles = master._element.find(qn("p:txStyles"))
+            lnSpc = parse_xml(
+                '<a:lnSpc %s><a:spcPct val="%d"/></a:lnSpc>'
+                % (nsdecls("a"), round(self.MCKINSEY_SPACING["line_spacing"] * 100000))
+            )
+            # lvlNpPr은 python-pptx 커스텀 요소가 아니므로 lxml로 직접 편집
+            for style_tag, text_type in (("p:titleStyle", "title"), ("p:bodyStyle", "body")):
+                template = self._rpr_templates[text_type]
+                for lvl_pPr in tx_styles.find(qn(style_tag)):
+                    if not self._style_level(lvl_pPr, template, lnSpc):
+                        return None
+            self._apply_theme_fonts(master.part.part_related_by(RT.THEME), _CJK_FONT)
+            return master._element
+        except Exception as e:
+            logger.debug(f"Could not apply master text styles: {e}")
+            return None
+
+    @staticmethod
+    def _style_level(lvl_pPr, template, lnSpc) -> bool:
+        """lvlNpPr의 줄간격과 defRPr을 템플릿으로 교체 (ea/cs 등 뒤쪽 자식은 유지)"""
+        defRPr = lvl_pPr.find(qn("a:defRPr"))
+        new_defRPr = deepcopy(template)
+        new_defRPr.tag = qn("a:defRPr")
+        if defRPr is not None:
+            kept = [child for child in defRPr if child.tag not in _REPLACEABLE_RPR_CHILDREN]
+            if any(child.tag not in _DEF_RPR_TRAILING_CHILDREN for child in kept):
+                return False  # 순서를 보장할 수 없는 자식(ln/effectLst 등)은 건드리지 않음
+            new_defRPr.extend(kept)
+            for key, value in defRPr.attrib.items():
+                if key not in new_defRPr.attrib:
+                    new_defRPr.set(key, value)
+            lvl_pPr.replace(defRPr, new_defRPr)
+        else:
+            ext_lst = lvl_pPr.find(qn("a:extLst"))
+            if ext_lst is not None:
+                ext_lst.addprevious(new_defRPr)
+            else:
+                lvl_pPr.append(new_defRPr)
+        for old in lvl_pPr.findall(qn("a:lnSpc")):
+            lvl_pPr.remove(old)
+        lvl_pPr.insert(0, deepcopy(lnSpc))
+        return True
+
+    @staticmethod
+    def _apply_theme_fonts(theme_part, font_name: str):
+        # 테마 파트는 XML 파트로 로드되지 않는 일반 Part이고, Part.blob은 읽기 전용 property라
+        # 공개 setter가 없음. 저장 시 Part.blob이 그대로 반환하는 _blob을 교체한다.
+        theme = etree.fromstring(theme_part.blob)
+        for typeface in theme.iterfind(
+            ".//a:fontScheme/*/a:latin", namespaces={"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+        ):
+            typeface.set("typeface", font_name)
+        theme_part._blob = etree.tostring(theme, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    @staticmethod
+    def _inherits_master_body_style(shape, styled_master) -> bool:
+        """본문 placeholder가 재정의 없이 스타일을 넣은 마스터 bodyStyle을 상속하는지"""
+        if styled_master is None or not shape.is_placeholder:
+            return False
+        if shape.placeholder_format.type not in _BODY_PLACEHOLDER_TYPES:
+            return False
+        if shape.part.slide_layout.slide_master._element is not styled_master:
+            return False
+        base = shape._base_placeholder
+        while base is not None:
+            if base._element.txBody.xpath(_LST_STYLE_OVERRIDES):
+                return False
+            base = getattr(base, "_base_placeholder", None)
+        return not shape.text_frame._txBody.xpath(_LST_STYLE_OVERRIDES)
+
+    @staticmethod
+    def _has_run_overrides(paragraph, runs) -> bool:
+        # 문단 줄간격이나 런 크기/굵기/색/라틴 폰트가 직접 지정되어 있으면 상속만으로 부족
+        pPr = paragraph._p.pPr
+        if pPr is not None and pPr.find(qn("a:lnSpc")) is not None:
+            return True
+        for run in runs:
+            rPr = run._r.rPr
+            if rPr is None:
+                continue
+            if "sz" in rPr.attrib or "b" in rPr.attrib:
+                return True
+            if any(child.tag in _REPLACEABLE_RPR_CHILDREN for child in rPr):
+                return True
+        return False
+
+    def _hide_master_shapes(self, slide):
+        # 타이틀 슬라이드에는 마스터 번호 필드를 표시하지 않음
+        try:
+            slide._element.set("showMasterSp", "0")
+        except Exception as e:
+            logger.debug(f"Could not hide master shapes: {e}")
+
     def _add_slide_number(self, slide, slide_idx: int):
         try:
             box = slide.shapes.add_textbox(Inches(12.0), Inches(7.0), Inches(0.8), Inches(0.3))
@@ -123,61 +328,82 @@ class DesignApplicator:
         except Exception as e:
             logger.debug(f"Could not add slide number: {e}")
 
-    async def _apply_text_style(self, shape, is_title: bool):
+    def _apply_text_style(self, shape, is_title: bool, styled_master=None):
         try:
+            # 빈 도형(레이아웃 placeholder 등)은 문단 XML 순회 생략
+            if not shape.has_text_frame or not any(t.text for t in shape._element.iter(_A_T)):
+                return
             tf = shape.text_frame
+            styles = {
+                "title": (self.MCKINSEY_FONTS["title"], self.COLORS["blue"], self._rpr_templates["title"]),
+                "body": (self.MCKINSEY_FONTS["body"], self.COLORS["gray"], self._rpr_templates["body"]),
+            }
+            line_spacing = self.MCKINSEY_SPACING["line_spacing"]
+            # 타이틀 슬라이드는 첫 문단 규칙이 상속 구조와 달라 항상 런 단위로 적용
+            inherits = not is_title and self._inherits_master_body_style(shape, styled_master)
             for i, paragraph in enumerate(tf.paragraphs):
-                text_type = "title" if (is_title and i == 0) else "body"
-                font_cfg = self.MCKINSEY_FONTS[text_type]
+                runs = paragraph.runs
+                if not runs:
+                    continue
+                if inherits and not self._has_run_overrides(paragraph, runs):
+                    continue
+                font_cfg, color, template = styles["title" if (is_title and i == 0) else "body"]
                 # 문단 정렬/간격
                 try:
-                    paragraph.line_spacing = self.MCKINSEY_SPACING["line_spacing"]
+                    paragraph.line_spacing = line_spacing
                 except Exception:
                     pass
                 # 런 단위 폰트 일관 적용 (한국어 글리프 우선)
                 try:
-                    for run in paragraph.runs:
-                        for fname in ['Noto Sans CJK KR', 'Noto Sans KR', 'NanumGothic', '맑은 고딕', font_cfg["name"], 'Arial']:
-                            try:
-                                run.font.name = fname
-                                break
-                            except Exception:
-                                continue
-                        run.font.size = font_cfg["size"]
-                        run.font.bold = font_cfg["bold"]
-                        run.font.color.rgb = self.COLORS["blue"] if text_type == "title" else self.COLORS["gray"]
+                    for run in runs:
+                        if self._replace_run_rpr(run._r, template):
+                            continue
+                        # 하이퍼링크/동아시아 폰트 등 보존해야 할 자식이 있으면 속성 단위로 적용
+                        font = run.font
+                        font.name = _CJK_FONT
+                        font.size = font_cfg["size"]
+                        font.bold = font_cfg["bold"]
+                        font.color.rgb = color
                 except Exception:
                     # 문단 폰트로 폴백
                     try:
-                        for fname in ['Noto Sans CJK KR', 'Noto Sans KR', 'NanumGothic', '맑은 고딕', font_cfg["name"], 'Arial']:
-                            try:
-                                paragraph.font.name = fname
-                                break
-                            except Exception:
-                                continue
-                        paragraph.font.size = font_cfg["size"]
-                        paragraph.font.bold = font_cfg["bold"]
-                        paragraph.font.color.rgb = self.COLORS["blue"] if text_type == "title" else self.COLORS["gray"]
+                        font = paragraph.font
+                        font.name = _CJK_FONT
+                        font.size = font_cfg["size"]
+                        font.bold = font_cfg["bold"]
+                        font.color.rgb = color
                     except Exception:
                         pass
         except Exception as e:
             logger.debug(f"Could not apply text style: {e}")
 
-    async def _apply_title_slide_style_improved(self, slide):
+    @staticmethod
+    def _replace_run_rpr(r, template) -> bool:
+        """런의 <a:rPr>을 템플릿 사본으로 교체 (기존 속성 중 템플릿에 없는 것은 유지)"""
+        rPr = r.rPr
+        if rPr is None:
+            r.insert(0, deepcopy(template))
+            return True
+        if any(child.tag not in _REPLACEABLE_RPR_CHILDREN for child in rPr):
+            return False
+        new_rPr = deepcopy(template)
+        for key, value in rPr.attrib.items():
+            if key not in new_rPr.attrib:
+                new_rPr.set(key, value)
+        r.replace(rPr, new_rPr)
+        return True
+
+    def _apply_title_slide_style_improved(self, slide):
         try:
             # pick the largest text shape with non-empty text
-            title_shape = None
-            max_area = 0
-            for shape in slide.shapes:
-                if hasattr(shape, "text_frame") and shape.text_frame.text.strip():
-                    try:
-                        area = int(shape.width) * int(shape.height)
-                    except Exception:
-                        area = 0
-                    if area > max_area:
-                        max_area = area
-                        title_shape = shape
-            if not title_shape:
+            # width/height는 이미 int(Emu)이며 상속 위치가 없으면 None
+            candidates = (
+                (shape, (shape.width or 0) * (shape.height or 0))
+                for shape in slide.shapes
+                if shape.has_text_frame and _has_text(shape)
+            )
+            title_shape, max_area = max(candidates, key=itemgetter(1), default=(None, 0))
+            if not title_shape or max_area <= 0:
                 return
 
             tf = title_shape.text_frame
@@ -187,25 +413,20 @@ class DesignApplicator:
             except Exception:
                 pass
 
-            title_text = tf.text or ""
-            n = len(title_text)
-            if n < 30:
-                fs = Pt(28)
-            elif n < 50:
-                fs = Pt(24)
-            elif n < 80:
-                fs = Pt(20)
-            else:
-                fs = Pt(18)
+            fs = _TITLE_SIZES[bisect.bisect_right(_TITLE_LIMITS, len(tf.text or ""))]
+            color = self.COLORS["blue"]
+            center = PP_ALIGN.CENTER
+            line_spacing = self.MCKINSEY_SPACING["line_spacing"]
 
             for p in tf.paragraphs:
-                p.font.name = "Arial"
-                p.font.size = fs
-                p.font.bold = True
-                p.font.color.rgb = self.COLORS["blue"]
-                p.alignment = PP_ALIGN.CENTER
+                font = p.font
+                font.name = "Arial"
+                font.size = fs
+                font.bold = True
+                font.color.rgb = color
+                p.alignment = center
                 try:
-                    p.line_spacing = self.MCKINSEY_SPACING["line_spacing"]
+                    p.line_spacing = line_spacing
                 except Exception:
                     pass
         except Exception as e:
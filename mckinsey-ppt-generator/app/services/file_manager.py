@@ -4,6 +4,8 @@ PPTX 파일 저장 및 경로 관리를 담당합니다.
 """
 
 import os
+import shutil
+from typing import IO, Union
 from app.core.config import settings
 from pathlib import Path
 from loguru import logger
@@ -23,13 +25,13 @@ class FileManager:
         """저장 경로 반환"""
         return self.storage_path
 
-    def save_file(self, filename: str, content: bytes) -> Path:
+    def save_file(self, filename: str, content: Union[bytes, IO[bytes]]) -> Path:
         """
         파일을 저장합니다.
 
         Args:
             filename: 저장할 파일 이름
-            content: 파일 내용 (bytes)
+            content: 파일 내용 (bytes 또는 읽기 가능한 바이너리 스트림)
         
         Returns:
             Path: 저장된 파일의 전체 경로
@@ -41,7 +43,11 @@ class FileManager:
         
         try:
             with open(file_path, "wb") as f:
-                f.write(content)
+                if hasattr(content, "read"):
+                    # 스트림은 1MB 단위로 복사 (bytes로 한 번 더 만들지 않음)
+                    shutil.copyfileobj(content, f, length=1 << 20)
+                else:
+                    f.write(content)
             logger.info(f"Successfully saved file to {file_path}")
             return file_path
         except IOError as e:
@@ -54,9 +60,16 @@ class FileManager:
 
     def cleanup_temp_files(self, directory: str):
         """임시 파일 정리"""
-        for item in Path(directory).glob("temp_*.png"):
-            try:
-                item.unlink()
-                logger.debug(f"Removed temp file: {item}")
-            except OSError as e:
-                logger.warning(f"Error removing temp file {item}: {e}")
+        # scandir의 DirEntry는 readdir 결과의 파일 타입을 재사용 (항목별 stat/Path 생성 없음)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith("temp_") and name.endswith(".png")):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                    logger.debug(f"Removed temp file: {entry.path}")
+                except OSError as e:
+                    logger.warning(f"Error removing temp file {entry.path}: {e}")
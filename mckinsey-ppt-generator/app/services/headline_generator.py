@@ -5,15 +5,103 @@ McKinsey 수준의 액션 지향적 헤드라인 생성
 - 정량화 강제
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass
+import functools
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 숫자 + 선택적 단위를 한 번에 스캔 (예: 10%, 1000억, 2.5배, 50명)
+_NUM_ALL = re.compile(r'(\d+\.?\d*)\s*(%|배|억|만)?')
+# 단위별 우선순위: 퍼센트 → 배수 → 억 → 만 (그다음 모든 숫자)
+_UNIT_RANK = {'%': 0, '배': 1, '억': 2, '만': 3}
 
-@dataclass
+
+def _iter_text_fields(value):
+    """str(value)가 담을 키/값 문자열을 같은 순서로 생성 (큰 중간 문자열 생성 없음)"""
+    if isinstance(value, dict):
+        for k, v in value.items():
+            yield from _iter_text_fields(k)
+            yield from _iter_text_fields(v)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for v in value:
+            yield from _iter_text_fields(v)
+    elif isinstance(value, str):
+        yield value
+    else:
+        yield repr(value)
+
+
+class _TokenStripTable(dict):
+    """str.translate용 지연 매핑: 단어 문자, 공백, '%' 외 문자는 삭제
+
+    기존 정규식의 유니코드 단어/공백 판정(isalnum 또는 '_', isspace)과 동일하며,
+    코드포인트별 판정은 처음 등장할 때 한 번만 계산해 저장한다.
+    """
+    
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        value = cp if (ch.isalnum() or ch == '_' or ch.isspace() or ch == '%') else None
+        self[cp] = value
+        return value
+
+
+_TOK_STRIP_TABLE = _TokenStripTable()
+_DIGIT_RE = re.compile(r'\d+')
+
+# McKinsey 키워드 (HeadlineGenerator와 SoWhatTester가 공유)
+_ACTION_VERBS = frozenset({
+    "제공", "확보", "달성", "실현", "개선", "증가", "감소",
+    "전환", "확대", "강화", "구축", "창출", "도출"
+})
+_IMPLICATION_KEYWORDS = frozenset({
+    "가능", "필요", "실현", "확보", "달성", "기회", "위협",
+    "중요", "핵심", "우선", "주요", "전략적"
+})
+
+
+def _alternation(words) -> re.Pattern:
+    # 긴 단어 우선 (공통 접두사가 있어도 가장 긴 후보부터 시도)
+    return re.compile("|".join(map(re.escape, sorted(words, key=lambda w: (-len(w), w)))))
+
+
+# 포함 여부를 한 번의 스캔으로 확인하는 alternation
+_VERB_RE = _alternation(_ACTION_VERBS)
+_IMPL_RE = _alternation(_IMPLICATION_KEYWORDS)
+# So What 테스터는 함의성 동사 '가능', '필요'도 액션으로 인정
+_TESTER_VERB_RE = _alternation(_ACTION_VERBS | {"가능", "필요"})
+
+
+# So What 검사 실패 비트
+_NO_VERB = 1
+_NO_NUMBER = 2
+_NO_IMPLICATION = 4
+_TOO_SHORT = 8
+_TOO_LONG = 16
+# 헤드라인 생성기의 통과 기준 (60자 초과는 최종 단계에서 자르므로 제외)
+_SO_WHAT_REQUIRED = _NO_VERB | _NO_NUMBER | _NO_IMPLICATION | _TOO_SHORT
+
+
+def _evaluate(headline: str, verb_re: re.Pattern = _VERB_RE) -> int:
+    """So What 검사를 한 번에 수행하고 실패한 항목의 비트 마스크를 반환"""
+    mask = 0
+    if verb_re.search(headline) is None:
+        mask |= _NO_VERB
+    if _DIGIT_RE.search(headline) is None:
+        mask |= _NO_NUMBER
+    if _IMPL_RE.search(headline) is None:
+        mask |= _NO_IMPLICATION
+    length = len(headline)
+    if length < 20:
+        mask |= _TOO_SHORT
+    elif length > 60:
+        mask |= _TOO_LONG
+    return mask
+
+
+@dataclass(slots=True, frozen=True)
 class HeadlineTemplate:
     """헤드라인 템플릿"""
     pattern: str
@@ -61,20 +149,59 @@ class HeadlineGenerator:
         )
     ]
     
+    # 카테고리 → 템플릿 (선택 시 선형 탐색 대신 O(1) 조회)
+    _TEMPLATES_BY_CAT = {template.category: template for template in TEMPLATES}
+    
     # McKinsey 키워드
-    ACTION_VERBS = [
-        "제공", "확보", "달성", "실현", "개선", "증가", "감소", 
-        "전환", "확대", "강화", "구축", "창출", "도출"
-    ]
+    ACTION_VERBS = _ACTION_VERBS
+    IMPLICATION_KEYWORDS = _IMPLICATION_KEYWORDS
     
-    IMPLICATION_KEYWORDS = [
-        "가능", "필요", "실현", "확보", "달성", "기회", "위협", 
-        "중요", "핵심", "우선", "주요", "전략적"
-    ]
+    # 키워드 → 헤드라인 액션 동사 (순서대로 우선 적용)
+    _VERB_MAP = {
+        "성장": "성장",
+        "증가": "증가",
+        "개선": "개선",
+        "확대": "확대",
+        "강화": "강화",
+        "감소": "절감",
+    }
+    _VERB_MAP_RE = re.compile("|".join(map(re.escape, _VERB_MAP)))
+    
+    # 변화 키워드 → 추가할 전략적 함의 (순서대로 우선 적용)
+    _IMPLICATION_PATTERNS = (
+        ("성장", "선점 효과 확보 가능"),
+        ("증가", "경쟁 우위 강화 기회"),
+        ("감소", "비용 절감 실현 가능"),
+        ("개선", "목표 달성 가능"),
+        ("변화", "시장 재편 주도 필요"),
+        ("차이", "차별화 전략 수립 필요"),
+    )
+    _IMPLICATION_PATTERN_RE = re.compile("|".join(re.escape(k) for k, _ in _IMPLICATION_PATTERNS))
+    
+    # 키워드 → 긍정적 결과 문구 (순서대로 우선 적용)
+    _RESULT_MAP = (
+        ("시장", "시장 선점 기회 확보"),
+        ("경쟁", "경쟁 우위 강화 가능"),
+        ("비용", "비용 절감 실현"),
+        ("매출", "매출 성장 가속화"),
+    )
+    
+    # 키워드 기반 템플릿 카테고리 감지 규칙 (순서대로 우선 적용)
+    _CATEGORY_RULES = (
+        (re.compile("대비|비교|경쟁"), "comparison"),
+        (re.compile("성장|증가|확대"), "growth"),
+        (re.compile("억|원|비용|매출"), "financial"),
+    )
     
     def __init__(self):
         """초기화"""
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # 템플릿 카테고리 → 문장 생성 함수
+        self._fillers = {
+            "growth": self._fill_growth,
+            "comparison": self._fill_comparison,
+            "strategic": self._fill_strategic,
+            "financial": self._fill_financial,
+        }
     
     def generate(
         self, 
@@ -91,21 +218,35 @@ class HeadlineGenerator:
         Returns:
             str: 액션 지향적 헤드라인
         """
+        # 하위 클래스는 동작이 다를 수 있어 공유 캐시 대상에서 제외
+        frozen = _freeze(content) if type(self) is HeadlineGenerator else None
+        if frozen is None:
+            # 해시할 수 없는 값이 섞여 있으면 캐시 없이 생성
+            return self._generate(content, slide_type)
+        headline = _generate_cached(frozen, slide_type)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Headline cache: {_generate_cached.cache_info()}")
+        return headline
+    
+    def _generate(self, content: Dict, slide_type: str) -> str:
+        """캐시를 거치지 않는 헤드라인 생성 본체"""
         try:
             # 1. 기존 제목 추출
             original_title = content.get("title", "")
             
             # 2. 키워드 추출
             keywords = self._extract_keywords(content)
+            # 템플릿/동사/결과 선택에서 공유하는 소문자 키워드 문자열
+            keyword_str = " ".join(keywords).lower()
             
             # 3. 숫자 추출
             numbers = self._extract_numbers(content)
             
             # 4. 템플릿 선택
-            template = self._select_template(slide_type, keywords, numbers)
+            template = self._select_template(slide_type, keywords, numbers, keyword_str)
             
             # 5. 헤드라인 생성
-            headline = self._fill_template(template, keywords, numbers, content)
+            headline = self._fill_template(template, keywords, numbers, content, keyword_str)
             
             # 6. So What 테스트
             if not self._passes_so_what_test(headline):
@@ -114,11 +255,12 @@ class HeadlineGenerator:
             # 7. 최종 검증
             headline = self._finalize_headline(headline, original_title)
             
-            self.logger.info(f"Generated headline: {headline}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Generated headline: {headline}")
             return headline
             
         except Exception as e:
-            self.logger.error(f"Headline generation failed: {e}")
+            logger.error(f"Headline generation failed: {e}")
             # 폴백: 원본 제목 개선
             return self._improve_existing_title(content.get("title", "제목 없음"))
     
@@ -131,35 +273,37 @@ class HeadlineGenerator:
         2. 동사 (액션)
         3. 형용사 (특성)
         """
-        keywords = []
-        
-        # 제목에서 추출
-        title = content.get("title", "")
-        keywords.extend(self._tokenize(title))
+        # 토큰을 순서 유지 집합(dict)에 바로 누적하고 5개가 차는 즉시 중단
+        unique_keywords = {}
+        for token in self._iter_tokens(content.get("title", "")):
+            unique_keywords[token] = None
+            if len(unique_keywords) == 5:
+                return list(unique_keywords)
         
-        # 본문에서 추출
         body = content.get("body", "")
         if isinstance(body, list):
             body = " ".join(body)
-        keywords.extend(self._tokenize(body))
+        for token in self._iter_tokens(body):
+            unique_keywords[token] = None
+            if len(unique_keywords) == 5:
+                break
         
-        # 중복 제거 및 상위 5개 반환
-        unique_keywords = list(dict.fromkeys(keywords))
-        return unique_keywords[:5]
+        return list(unique_keywords)
     
     def _tokenize(self, text: str) -> List[str]:
         """간단한 토큰화 (공백 기준)"""
+        return list(self._iter_tokens(text))
+    
+    @staticmethod
+    def _iter_tokens(text: str) -> Iterator[str]:
+        """_tokenize의 제너레이터 버전 (토큰 리스트를 만들지 않음)"""
         if not text:
-            return []
-        
-        # 특수문자 제거
-        text = re.sub(r'[^\w\s%]', '', text)
-        
-        # 공백으로 분리
-        tokens = text.split()
+            return
         
-        # 2글자 이상만 반환
-        return [t for t in tokens if len(t) >= 2]
+        # 특수문자 제거 후 공백으로 분리, 2글자 이상만 반환
+        for token in text.translate(_TOK_STRIP_TABLE).split():
+            if len(token) >= 2:
+                yield token
     
     def _extract_numbers(self, content: Dict) -> List[float]:
         """
@@ -167,30 +311,28 @@ class HeadlineGenerator:
         """
         numbers = []
         
-        # 전체 콘텐츠 문자열화
-        text = str(content)
-        
-        # 숫자 패턴 매칭
-        # 예: 10%, 1000억, 2.5배, 50명
-        patterns = [
-            r'(\d+\.?\d*)\s*%',      # 퍼센트
-            r'(\d+\.?\d*)\s*배',      # 배수
-            r'(\d+\.?\d*)\s*억',      # 억 단위
-            r'(\d+\.?\d*)\s*만',      # 만 단위
-            r'(\d+\.?\d*)',           # 일반 숫자
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            numbers.extend([float(m) for m in matches if m])
-        
-        return numbers[:3]  # 상위 3개
+        # 콘텐츠 전체를 str()로 만들지 않고 키/값 문자열을 순서대로 스캔,
+        # 단위별 버킷에 분류 후 우선순위 순으로 이어붙임
+        by_unit = ([], [], [], [])
+        percents = by_unit[0]
+        for text in _iter_text_fields(content):
+            for value, unit in _NUM_ALL.findall(text):
+                number = float(value)
+                if unit:
+                    by_unit[_UNIT_RANK[unit]].append(number)
+                numbers.append(number)
+            # 최우선 버킷(퍼센트)이 3개 차면 결과가 확정되므로 나머지 필드는 생략
+            if len(percents) >= 3:
+                return percents[:3]
+        
+        return (by_unit[0] + by_unit[1] + by_unit[2] + by_unit[3] + numbers)[:3]  # 상위 3개
     
     def _select_template(
         self, 
         slide_type: str, 
         keywords: List[str], 
-        numbers: List[float]
+        numbers: List[float],
+        keyword_str: Optional[str] = None
     ) -> HeadlineTemplate:
         """
         슬라이드 타입과 콘텐츠에 맞는 템플릿 선택
@@ -201,32 +343,25 @@ class HeadlineGenerator:
         3. 전략/목표 키워드 → strategic
         4. 금액/비용 키워드 → financial
         """
-        # 키워드 기반 카테고리 감지
-        keyword_str = " ".join(keywords).lower()
-        
-        if any(word in keyword_str for word in ["대비", "비교", "경쟁"]):
-            category = "comparison"
-        elif any(word in keyword_str for word in ["성장", "증가", "확대"]):
-            category = "growth"
-        elif any(word in keyword_str for word in ["억", "원", "비용", "매출"]):
-            category = "financial"
-        else:
-            category = "strategic"
+        # 키워드 기반 카테고리 감지 (호출자가 계산한 문자열이 있으면 재사용)
+        if keyword_str is None:
+            keyword_str = " ".join(keywords).lower()
         
-        # 카테고리에 맞는 템플릿 찾기
-        for template in self.TEMPLATES:
-            if template.category == category:
-                return template
+        category = next(
+            (name for pattern, name in self._CATEGORY_RULES if pattern.search(keyword_str)),
+            "strategic"
+        )
         
-        # 기본값: 첫 번째 템플릿
-        return self.TEMPLATES[0]
+        # 카테고리에 맞는 템플릿 (기본값: 첫 번째 템플릿)
+        return self._TEMPLATES_BY_CAT.get(category, self.TEMPLATES[0])
     
     def _fill_template(
         self, 
         template: HeadlineTemplate, 
         keywords: List[str], 
         numbers: List[float],
-        content: Dict
+        content: Dict,
+        keyword_str: Optional[str] = None
     ) -> str:
         """
         템플릿에 실제 값 채우기
@@ -236,67 +371,62 @@ class HeadlineGenerator:
         입력: keywords=["시장", "성장"], numbers=[50]
         출력: "시장이 3년 내 50% 성장하여 최대 기회 제공"
         """
+        if keyword_str is None:
+            keyword_str = " ".join(keywords).lower()
+        
         # 기본값 설정
         subject = keywords[0] if keywords else "주요 영역"
-        action = self._select_action_verb(keywords)
+        action = self._select_action_verb(keyword_str)
         number = int(numbers[0]) if numbers else 10
-        result = self._generate_result(keywords, number)
+        result = self._generate_result(keyword_str, number)
         
         # 템플릿 카테고리별 처리
-        if template.category == "growth":
-            return f"{subject}이 3년 내 {number}% {action}하여 {result}"
-        
-        elif template.category == "comparison":
-            benchmark = keywords[1] if len(keywords) > 1 else "업계 평균"
-            multiplier = round(number / 10) if number > 10 else 2
-            return f"{benchmark} 대비 {multiplier}배 빠른 {subject}이 {result}"
-        
-        elif template.category == "strategic":
-            characteristic = keywords[1] if len(keywords) > 1 else "핵심 역량"
-            return f"{subject}의 {characteristic}이 {number}% 개선으로 {result}"
-        
-        elif template.category == "financial":
-            amount_str = f"{number}억원" if number < 1000 else f"{int(number/1000)}조원"
-            return f"{subject}의 {action}을 통해 2년 내 {amount_str} {result}"
-        
+        filler = self._fillers.get(template.category, self._fill_default)
+        return filler(subject, action, number, result, keywords)
+    
+    @staticmethod
+    def _fill_default(subject: str, action: str, number: int, result: str, keywords: List[str]) -> str:
         # 폴백
         return f"{subject}이 {number}% {action}하여 {result}"
     
-    def _select_action_verb(self, keywords: List[str]) -> str:
-        """키워드에서 적절한 액션 동사 선택"""
-        keyword_str = " ".join(keywords).lower()
-        
-        verb_map = {
-            "성장": "성장",
-            "증가": "증가",
-            "개선": "개선",
-            "확대": "확대",
-            "강화": "강화",
-            "감소": "절감",
-        }
-        
-        for keyword, verb in verb_map.items():
-            if keyword in keyword_str:
-                return verb
+    @staticmethod
+    def _fill_growth(subject: str, action: str, number: int, result: str, keywords: List[str]) -> str:
+        return f"{subject}이 3년 내 {number}% {action}하여 {result}"
+    
+    @staticmethod
+    def _fill_comparison(subject: str, action: str, number: int, result: str, keywords: List[str]) -> str:
+        benchmark = keywords[1] if len(keywords) > 1 else "업계 평균"
+        multiplier = round(number / 10) if number > 10 else 2
+        return f"{benchmark} 대비 {multiplier}배 빠른 {subject}이 {result}"
+    
+    @staticmethod
+    def _fill_strategic(subject: str, action: str, number: int, result: str, keywords: List[str]) -> str:
+        characteristic = keywords[1] if len(keywords) > 1 else "핵심 역량"
+        return f"{subject}의 {characteristic}이 {number}% 개선으로 {result}"
+    
+    @staticmethod
+    def _fill_financial(subject: str, action: str, number: int, result: str, keywords: List[str]) -> str:
+        amount_str = f"{number}억원" if number < 1000 else f"{int(number/1000)}조원"
+        return f"{subject}의 {action}을 통해 2년 내 {amount_str} {result}"
+    
+    def _select_action_verb(self, keyword_str: str) -> str:
+        """키워드에서 적절한 액션 동사 선택 (keyword_str: 소문자로 이어붙인 키워드)"""
+        hits = set(self._VERB_MAP_RE.findall(keyword_str))
+        if hits:
+            for keyword, verb in self._VERB_MAP.items():
+                if keyword in hits:
+                    return verb
         
         return "개선"  # 기본값
     
-    def _generate_result(self, keywords: List[str], number: float) -> str:
-        """결과 문구 생성"""
-        keyword_str = " ".join(keywords).lower()
-        
+    def _generate_result(self, keyword_str: str, number: float) -> str:
+        """결과 문구 생성 (keyword_str: 소문자로 이어붙인 키워드)"""
         # 긍정적 결과
         if number > 0:
-            if "시장" in keyword_str:
-                return "시장 선점 기회 확보"
-            elif "경쟁" in keyword_str:
-                return "경쟁 우위 강화 가능"
-            elif "비용" in keyword_str:
-                return "비용 절감 실현"
-            elif "매출" in keyword_str:
-                return "매출 성장 가속화"
-            else:
-                return "목표 달성 가능"
+            for keyword, result in self._RESULT_MAP:
+                if keyword in keyword_str:
+                    return result
+            return "목표 달성 가능"
         
         # 부정적 결과 (음수)
         else:
@@ -312,12 +442,7 @@ class HeadlineGenerator:
         3. 함의 키워드 ("가능", "필요" 등)
         4. 20자 이상 (충분한 정보)
         """
-        has_verb = any(verb in headline for verb in self.ACTION_VERBS)
-        has_number = bool(re.search(r'\d+', headline))
-        has_implication = any(word in headline for word in self.IMPLICATION_KEYWORDS)
-        sufficient_length = len(headline) >= 20
-        
-        return all([has_verb, has_number, has_implication, sufficient_length])
+        return not _evaluate(headline) & _SO_WHAT_REQUIRED
     
     def _enhance_with_implication(self, headline: str, content: Dict) -> str:
         """
@@ -327,27 +452,17 @@ class HeadlineGenerator:
         "시장이 성장한다" 
         → "시장 성장으로 조기 진입 시 선점 효과 확보 가능"
         """
-        implication_patterns = {
-            "성장": "선점 효과 확보 가능",
-            "증가": "경쟁 우위 강화 기회",
-            "감소": "비용 절감 실현 가능",
-            "개선": "목표 달성 가능",
-            "변화": "시장 재편 주도 필요",
-            "차이": "차별화 전략 수립 필요",
-        }
+        # 이미 함의 포함 시 중복 방지
+        if _IMPL_RE.search(headline) is not None:
+            return headline
         
-        for keyword, implication in implication_patterns.items():
-            if keyword in headline:
-                # 이미 함의 포함 시 중복 방지
-                if any(imp in headline for imp in self.IMPLICATION_KEYWORDS):
-                    return headline
+        hits = set(self._IMPLICATION_PATTERN_RE.findall(headline))
+        for keyword, implication in self._IMPLICATION_PATTERNS:
+            if keyword in hits:
                 return f"{headline}, {implication}"
         
         # 기본 함의 추가
-        if not any(imp in headline for imp in self.IMPLICATION_KEYWORDS):
-            return f"{headline}, 전략적 대응 필요"
-        
-        return headline
+        return f"{headline}, 전략적 대응 필요"
     
     def _finalize_headline(self, headline: str, original: str) -> str:
         """
@@ -383,7 +498,7 @@ class HeadlineGenerator:
             return "핵심 인사이트 및 전략적 시사점"
         
         # 이미 좋은 제목이면 그대로
-        if len(title) >= 20 and any(verb in title for verb in self.ACTION_VERBS):
+        if len(title) >= 20 and _VERB_RE.search(title) is not None:
             return title
         
         # 개선 패턴
@@ -401,13 +516,75 @@ class HeadlineGenerator:
         return improvements[0]
 
 
+_FROZEN_SCALARS = (str, int, float, bool)
+
+
+def _freeze(value):
+    """콘텐츠를 타입 정보가 포함된 해시 가능한 키로 변환 (불가능하면 None)
+
+    dict 순서는 숫자 추출 순서에 영향을 주므로 정렬하지 않고 삽입 순서를 유지한다.
+    컨테이너는 _thaw로 그대로 복원할 수 있도록 정확히 dict/list/tuple만 허용한다.
+    """
+    t = type(value)
+    if t is str:
+        return (str, value)
+    if t is dict:
+        items = []
+        for k, v in value.items():
+            fk, fv = _freeze(k), _freeze(v)
+            if fk is None or fv is None:
+                return None
+            items.append((fk, fv))
+        return (dict, tuple(items))
+    if t is list or t is tuple:
+        frozen = []
+        for v in value:
+            fv = _freeze(v)
+            if fv is None:
+                return None
+            frozen.append(fv)
+        return (t, tuple(frozen))
+    if value is None or isinstance(value, _FROZEN_SCALARS):
+        # 1 / 1.0 / True는 해시가 같지만 문자열화 결과가 달라 타입까지 키에 포함
+        return (t, value)
+    return None
+
+
+def _thaw(frozen):
+    """_freeze 결과에서 같은 내용의 콘텐츠를 다시 생성"""
+    t, value = frozen
+    if t is dict:
+        return {_thaw(k): _thaw(v) for k, v in value}
+    if t is list:
+        return [_thaw(v) for v in value]
+    if t is tuple:
+        return tuple(_thaw(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=512)
+def _generate_cached(frozen, slide_type: str) -> str:
+    # 키는 고정된 콘텐츠뿐이므로 호출자의 dict나 생성기 인스턴스를 붙잡아 두지 않음
+    return HeadlineGenerator()._generate(_thaw(frozen), slide_type)
+
+
 class SoWhatTester:
     """
     So What 테스트 자동화
     """
     
-    def __init__(self):
-        self.logger = logging.getLogger(self.__class__.__name__)
+    # (실패 비트, 문제, 제안, 감점) - 검사 순서대로
+    _CHECKS = (
+        # 1. 액션성 검사 (30%)
+        (_NO_VERB, "액션 동사 부재", "'제공', '확보', '달성', '실현' 등 동사 추가", 0.3),
+        # 2. 정량화 검사 (30%)
+        (_NO_NUMBER, "정량화 부재", "구체적 숫자나 비율 추가 (예: 20%, 2배)", 0.3),
+        # 3. 함의 검사 (20%)
+        (_NO_IMPLICATION, "전략적 함의 부재", "'가능', '필요', '확보' 등 함의 키워드 추가", 0.2),
+        # 4. 길이 검사 (20%)
+        (_TOO_SHORT, "헤드라인 너무 짧음 (20자 미만)", "배경이나 결과 추가하여 20자 이상 작성", 0.2),
+        (_TOO_LONG, "헤드라인 너무 김 (60자 초과)", "핵심만 남기고 60자 이내로 축약", 0.1),
+    )
     
     def test(self, headline: str) -> Dict[str, any]:
         """
@@ -425,33 +602,12 @@ class SoWhatTester:
         suggestions = []
         score = 1.0
         
-        # 1. 액션성 검사 (30%)
-        if not self._has_action_verb(headline):
-            issues.append("액션 동사 부재")
-            suggestions.append("'제공', '확보', '달성', '실현' 등 동사 추가")
-            score -= 0.3
-        
-        # 2. 정량화 검사 (30%)
-        if not self._has_quantification(headline):
-            issues.append("정량화 부재")
-            suggestions.append("구체적 숫자나 비율 추가 (예: 20%, 2배)")
-            score -= 0.3
-        
-        # 3. 함의 검사 (20%)
-        if not self._has_implication(headline):
-            issues.append("전략적 함의 부재")
-            suggestions.append("'가능', '필요', '확보' 등 함의 키워드 추가")
-            score -= 0.2
-        
-        # 4. 길이 검사 (20%)
-        if len(headline) < 20:
-            issues.append("헤드라인 너무 짧음 (20자 미만)")
-            suggestions.append("배경이나 결과 추가하여 20자 이상 작성")
-            score -= 0.2
-        elif len(headline) > 60:
-            issues.append("헤드라인 너무 김 (60자 초과)")
-            suggestions.append("핵심만 남기고 60자 이내로 축약")
-            score -= 0.1
+        mask = _evaluate(headline, _TESTER_VERB_RE)
+        for bit, issue, suggestion, penalty in self._CHECKS:
+            if mask & bit:
+                issues.append(issue)
+                suggestions.append(suggestion)
+                score -= penalty
         
         result = {
             "passed": score >= 0.7,
@@ -460,26 +616,6 @@ class SoWhatTester:
             "suggestions": suggestions
         }
         
-        self.logger.info(f"So What test result: {result}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"So What test result: {result}")
         return result
-    
-    def _has_action_verb(self, headline: str) -> bool:
-        """액션 동사 포함 여부"""
-        action_verbs = [
-            "제공", "확보", "달성", "실현", "개선", "증가", "감소",
-            "전환", "확대", "강화", "구축", "창출", "도출", "가능", "필요"
-        ]
-        return any(verb in headline for verb in action_verbs)
-    
-    def _has_quantification(self, headline: str) -> bool:
-        """정량화 포함 여부"""
-        # 숫자 패턴
-        return bool(re.search(r'\d+', headline))
-    
-    def _has_implication(self, headline: str) -> bool:
-        """함의 키워드 포함 여부"""
-        implication_keywords = [
-            "가능", "필요", "실현", "확보", "달성", "기회", "위협",
-            "중요", "핵심", "우선", "주요", "전략적"
-        ]
-        return any(keyword in headline for keyword in implication_keywords)
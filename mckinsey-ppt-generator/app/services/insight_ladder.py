@@ -7,13 +7,163 @@ Level 4: Action (전략/권고) - "라인 확대로 20% 추가 성장 가능"
 """
 
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from fractions import Fraction
 from enum import Enum
+import functools
+import numbers
 import re
+import sys
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 숫자 + 선택적 단위를 한 번에 스캔 (예: 10%, 2.5배, 1000억, 3조)
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)\s*(%|배|억|조)?')
+# 단위별 출력 순서: 퍼센트 → 배수 → 억 → 조 (그다음 모든 숫자)
+_UNIT_RANK = {'%': 0, '배': 1, '억': 2, '조': 3}
+_DIGIT_RE = re.compile(r'\d+')
+# 함의 문장의 주요 기여자 ("신제품이 ...")
+_DRIVER_RE = re.compile(r'(\w+)이')
+
+# 함의 키워드 → 권고 전략 유형 (한 번의 스캔으로 모두 찾음)
+_ACTION_KEYWORD_TYPES = {
+    "기여": "contribution",
+    "증가": "growth", "성장": "growth",
+    "감소": "decline", "악화": "decline",
+    "경쟁": "competition",
+    "시장": "market",
+}
+_ACTION_DISPATCH_RE = re.compile("|".join(_ACTION_KEYWORD_TYPES))
+# 여러 유형이 함께 나오면 앞선 유형 우선
+_ACTION_TYPE_PRIORITY = ("contribution", "growth", "decline", "competition", "market")
+# 권고 전략 유형 → 권고 문구 템플릿
+_ACTION_TEMPLATES = {
+    # 기여 요인 기반 전략 (주요 기여자 추출 성공/실패)
+    "contribution_driver": "{driver} 영역 투자 확대로 {metric} 30% 추가 성장 가능",
+    "contribution": "핵심 성장 동력 강화로 {metric} 지속 성장 가능",
+    # 증가 트렌드 기반 전략
+    "growth": "성장 모멘텀 유지 위한 선제적 투자로 {metric} 극대화 필요",
+    # 감소 트렌드 기반 전략
+    "decline": "{metric} 개선 위한 즉각적 대응 조치 및 구조 개선 필요",
+    # 경쟁 관련 전략
+    "competition": "경쟁 우위 확보 위한 차별화 전략 수립 및 실행 필요",
+    # 시장 관련 전략
+    "market": "시장 변화 대응 전략 마련 및 신속한 실행 필요",
+    # 기본 전략
+    None: "{metric} 최적화 위한 전략적 접근 및 투자 필요",
+}
+
+# 일반적인 지표 키워드 (순서대로 우선 적용)
+_METRIC_KEYWORDS = (
+    "매출", "수익", "이익", "비용", "시장", "점유율",
+    "성장률", "만족도", "효율", "생산성", "품질"
+)
+
+
+def _extract_metric(text: str) -> str:
+    """텍스트에서 지표명 추출"""
+    for metric in _METRIC_KEYWORDS:
+        if metric in text:
+            return metric
+    
+    # 폴백: 첫 단어
+    words = text.split()
+    return words[0] if words else "지표"
+
+
+# 덱마다 같은 제목이 반복되므로 결과를 재사용
+_extract_metric_cached = functools.lru_cache(maxsize=1024)(_extract_metric)
+
+# climb 결과에 영향을 주는 데이터 필드
+_CLIMB_FIELDS = ("metric", "value", "previous_value", "benchmark", "period", "unit")
+_MISSING = object()
+_SCALAR_TYPES = (type(None), str, int, float, bool)
+
+
+def _climb_key(data: Dict) -> Optional[tuple]:
+    """climb 캐시 키 생성 (해시할 수 없는 값이 있으면 None)
+
+    값의 타입(1 / 1.0 / True)과 drivers 순서가 문구에 그대로 드러나므로
+    타입을 함께 담고 drivers는 정렬하지 않는다.
+    """
+    key = []
+    for field in _CLIMB_FIELDS:
+        value = data.get(field, _MISSING)
+        if value is not _MISSING and type(value) not in _SCALAR_TYPES:
+            return None
+        key.append((type(value), value))
+    
+    drivers = data.get("drivers", _MISSING)
+    if isinstance(drivers, dict):
+        items = []
+        for name, contribution in drivers.items():
+            if type(name) not in _SCALAR_TYPES or type(contribution) not in _SCALAR_TYPES:
+                return None
+            items.append((type(name), name, type(contribution), contribution))
+        key.append((dict, tuple(items)))
+    elif drivers is _MISSING or type(drivers) in _SCALAR_TYPES:
+        key.append((type(drivers), drivers))
+    else:
+        return None
+    
+    return tuple(key)
+
+
+# Python 3.12 이전의 Fraction은 '.1f' 형식 지정을 지원하지 않아 문구 생성에 쓸 수 없음
+_UNFORMATTABLE_TYPES = (Fraction,) if sys.version_info < (3, 12) else ()
+
+
+def _is_number(value) -> bool:
+    """사다리 계산에 쓸 수 있는 숫자인지 (Decimal은 numbers.Real이 아니므로 별도 허용, 비교가 불가한 NaN 제외)"""
+    if isinstance(value, Decimal):
+        return not value.is_nan()
+    return isinstance(value, numbers.Real) and not isinstance(value, _UNFORMATTABLE_TYPES)
+
+
+def _is_climbable(data) -> bool:
+    """4단계 인사이트 생성이 가능한 데이터인지 검사
+
+    현재값/이전값/벤치마크는 숫자(이전값/벤치마크는 None 허용),
+    drivers는 비어 있거나 값이 모두 숫자인 dict여야 한다.
+    Decimal은 float와 연산할 수 없으므로 현재값과 실제로 계산되는
+    이전값/벤치마크(양수인 경우) 중 한쪽만 Decimal이면 다른 쪽은 int여야 한다.
+    """
+    if not isinstance(data, dict):
+        return False
+    value = data.get("value", 0)
+    if not _is_number(value):
+        return False
+    for field in ("previous_value", "benchmark"):
+        other = data.get(field)
+        if other is None:
+            continue
+        if not _is_number(other):
+            return False
+        if not other > 0:
+            continue
+        if isinstance(value, Decimal) or isinstance(other, Decimal):
+            if not (isinstance(value, (int, Decimal)) and isinstance(other, (int, Decimal))):
+                return False
+            # Decimal 무한대끼리의 뺄셈/나눗셈은 InvalidOperation (성장률은 항상 이전값으로 나눔)
+            if isinstance(other, Decimal) and other.is_infinite() and (
+                field == "previous_value" or (isinstance(value, Decimal) and value.is_infinite())
+            ):
+                return False
+    drivers = data.get("drivers", {})
+    if drivers:
+        if not isinstance(drivers, dict):
+            return False
+        if not all(_is_number(v) for v in drivers.values()):
+            return False
+        # 최대 기여 요인을 고를 때 Decimal과 float NaN은 비교할 수 없음
+        if any(isinstance(v, Decimal) for v in drivers.values()) and any(
+            isinstance(v, float) and v != v for v in drivers.values()
+        ):
+            return False
+    return True
+
 
 class InsightLevel(Enum):
     """인사이트 수준"""
@@ -23,7 +173,7 @@ class InsightLevel(Enum):
     ACTION = 4          # "라인 확대 필요"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Insight:
     """인사이트 데이터"""
     level: InsightLevel
@@ -33,6 +183,18 @@ class Insight:
     metrics: Optional[Dict] = None
 
 
+def _detach(insight: Insight) -> Insight:
+    """캐시에 보관한 Insight의 evidence/metrics 사본을 가진 Insight 반환
+
+    frozen이어도 list/dict 필드는 변경 가능하므로 호출자가 캐시 내용을 바꾸지 못하게 한다.
+    """
+    return replace(
+        insight,
+        evidence=list(insight.evidence),
+        metrics=dict(insight.metrics) if insight.metrics is not None else None,
+    )
+
+
 class InsightLadder:
     """
     데이터를 4단계 인사이트로 변환
@@ -59,9 +221,13 @@ class InsightLadder:
         "확대", "강화", "개선", "투자", "집중", "전환"
     ]
     
+    # climb 결과 캐시 최대 크기 (초과 시 비움)
+    CACHE_SIZE = 512
+    
     def __init__(self):
         """초기화"""
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._cache: Dict[tuple, List[Insight]] = {}
     
     def climb(self, data: Dict) -> List[Insight]:
         """
@@ -80,32 +246,46 @@ class InsightLadder:
         Returns:
             List[Insight]: Level 1-4 인사이트 리스트
         """
-        insights = []
-        
-        try:
-            # Level 1: Observation
-            observation = self._create_observation(data)
-            insights.append(observation)
-            
-            # Level 2: Comparison
-            comparison = self._create_comparison(data, observation)
-            insights.append(comparison)
-            
-            # Level 3: Implication
-            implication = self._create_implication(data, comparison)
-            insights.append(implication)
-            
-            # Level 4: Action
-            action = self._create_action(data, implication)
-            insights.append(action)
-            
-            self.logger.info(f"Generated {len(insights)} level insights")
-            return insights
-            
-        except Exception as e:
-            self.logger.error(f"Insight generation failed: {e}")
+        # 같은 KPI 데이터가 반복 렌더링되므로 결과를 재사용
+        key = _climb_key(data) if isinstance(data, dict) else None
+        if key is None:
+            return self._climb(data)
+        
+        cached = self._cache.get(key)
+        if cached is None:
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            cached = self._cache.setdefault(key, self._climb(data))
+        return [_detach(insight) for insight in cached]
+    
+    def _climb(self, data: Dict) -> List[Insight]:
+        """캐시를 거치지 않는 인사이트 생성 본체"""
+        # 사다리를 오를 수 없는 데이터는 미리 걸러 폴백 (숫자가 아닌 값 등)
+        if not _is_climbable(data):
+            self.logger.warning("Insight data not climbable, falling back to observation")
             # 폴백: Level 1만 반환
             return [self._create_fallback_observation(data)]
+        
+        insights = []
+        
+        # Level 1: Observation
+        observation = self._create_observation(data)
+        insights.append(observation)
+        
+        # Level 2: Comparison
+        comparison = self._create_comparison(data, observation)
+        insights.append(comparison)
+        
+        # Level 3: Implication
+        implication = self._create_implication(data, comparison)
+        insights.append(implication)
+        
+        # Level 4: Action
+        action = self._create_action(data, implication)
+        insights.append(action)
+        
+        self.logger.info(f"Generated {len(insights)} level insights")
+        return insights
     
     def _create_observation(self, data: Dict) -> Insight:
         """
@@ -193,8 +373,8 @@ class InsightLadder:
         
         if drivers:
             # 가장 큰 기여 요인 찾기
-            main_driver = max(drivers.items(), key=lambda x: x[1])
-            driver_name, contribution = main_driver
+            driver_name = max(drivers, key=drivers.get)
+            contribution = drivers[driver_name]
             
             statement = f"{driver_name}이 {metric}의 {contribution:.0f}% 기여"
             confidence = 0.85
@@ -262,37 +442,19 @@ class InsightLadder:
         - "감소" → 개선 조치
         - "경쟁" → 차별화 전략
         """
-        implication_lower = implication.lower()
+        # 키워드가 모두 한글이라 대소문자 변환(lower) 없이 그대로 스캔
+        found = {_ACTION_KEYWORD_TYPES[k] for k in _ACTION_DISPATCH_RE.findall(implication)}
+        action_type = next((t for t in _ACTION_TYPE_PRIORITY if t in found), None)
         
-        # 1. 기여 요인 기반 전략
-        if "기여" in implication_lower:
+        driver = None
+        if action_type == "contribution":
             # 주요 기여자 추출
-            match = re.search(r'(\w+)이', implication)
+            match = _DRIVER_RE.search(implication)
             if match:
                 driver = match.group(1)
-                return f"{driver} 영역 투자 확대로 {metric} 30% 추가 성장 가능"
-            else:
-                return f"핵심 성장 동력 강화로 {metric} 지속 성장 가능"
+                action_type = "contribution_driver"
         
-        # 2. 증가 트렌드 기반 전략
-        elif "증가" in implication_lower or "성장" in implication_lower:
-            return f"성장 모멘텀 유지 위한 선제적 투자로 {metric} 극대화 필요"
-        
-        # 3. 감소 트렌드 기반 전략
-        elif "감소" in implication_lower or "악화" in implication_lower:
-            return f"{metric} 개선 위한 즉각적 대응 조치 및 구조 개선 필요"
-        
-        # 4. 경쟁 관련 전략
-        elif "경쟁" in implication_lower:
-            return f"경쟁 우위 확보 위한 차별화 전략 수립 및 실행 필요"
-        
-        # 5. 시장 관련 전략
-        elif "시장" in implication_lower:
-            return f"시장 변화 대응 전략 마련 및 신속한 실행 필요"
-        
-        # 6. 기본 전략
-        else:
-            return f"{metric} 최적화 위한 전략적 접근 및 투자 필요"
+        return _ACTION_TEMPLATES[action_type].format(metric=metric, driver=driver)
     
     def _format_number(self, value: float, unit: str = "") -> str:
         """숫자 포맷팅 (한국식)"""
@@ -434,42 +596,29 @@ class InsightEnhancer:
     
     def _extract_metric_from_text(self, text: str) -> str:
         """텍스트에서 지표명 추출"""
-        # 일반적인 지표 키워드
-        metrics = [
-            "매출", "수익", "이익", "비용", "시장", "점유율",
-            "성장률", "만족도", "효율", "생산성", "품질"
-        ]
-        
-        for metric in metrics:
-            if metric in text:
-                return metric
-        
-        # 폴백: 첫 단어
-        words = text.split()
-        return words[0] if words else "지표"
+        if isinstance(text, str):
+            return _extract_metric_cached(text)
+        return _extract_metric(text)
     
     def _extract_numbers_from_text(self, text: str) -> List[float]:
         """
         텍스트에서 숫자 추출"""
-        # 숫자 패턴 (퍼센트, 배수, 억 등 포함)
-        patterns = [
-            r'(\d+\.?\d*)\s*%',
-            r'(\d+\.?\d*)\s*배',
-            r'(\d+\.?\d*)\s*억',
-            r'(\d+\.?\d*)\s*조',
-            r'(\d+\.?\d*)'
-        ]
+        # 숫자가 전혀 없는 텍스트(대부분의 본문)는 버킷 생성 없이 바로 반환
+        if _DIGIT_RE.search(text) is None:
+            return []
         
         numbers = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                try:
-                    numbers.append(float(match))
-                except ValueError:
-                    continue
         
-        return numbers
+        # 텍스트를 한 번만 스캔해 단위별 버킷에 분류 후 우선순위 순으로 이어붙임
+        # (단위가 붙은 숫자는 해당 단위 버킷과 전체 숫자 양쪽에 포함)
+        by_unit = ([], [], [], [])
+        for value, unit in _NUMBER_RE.findall(text):
+            number = float(value)
+            if unit:
+                by_unit[_UNIT_RANK[unit]].append(number)
+            numbers.append(number)
+        
+        return by_unit[0] + by_unit[1] + by_unit[2] + by_unit[3] + numbers
 
 
 class InsightQualityEvaluator:
@@ -511,7 +660,7 @@ class InsightQualityEvaluator:
         
         # 3. 정량화 포함 여부
         has_quantification = any(
-            re.search(r'\d+', i.statement) for i in insights
+            _DIGIT_RE.search(i.statement) for i in insights
         )
         
         # 4. 종합 점수 계산
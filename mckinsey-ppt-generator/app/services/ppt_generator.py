@@ -28,7 +28,7 @@ from PIL import Image
 
 from app.core.config import settings
 from app.models.presentation import Presentation as PresentationModel, Slide as SlideModel
-from app.services.content_analyzer import ContentAnalyzer
+from app.services.content_analyzer import content_analyzer
 from app.services.layout_library import LayoutLibrary
 from app.services.layout_applier import LayoutApplier
 from app.services.text_fitter import TextFitter
@@ -95,7 +95,7 @@ class PPTGenerator:
         """
         self.db = db
         self.mckinsey_styles = McKinseyStyles()
-        self.content_analyzer = ContentAnalyzer()
+        self.content_analyzer = content_analyzer
         self.layout_library = LayoutLibrary()
         self.layout_applier = LayoutApplier()
         self.text_fitter = TextFitter()
@@ -8,6 +8,7 @@ Minimal pipeline used by scripts/run_ai_pipeline.py:
 - Validation -> (optional) Auto-fix -> re-validation
 - Quality evaluation (guarded) -> Save
 """
+import asyncio
 import os
 import time
 import logging
@@ -185,23 +186,8 @@ class WorkflowOrchestrator:
             except Exception:
                 pass
 
-            # Save
-            prs.save(str(out_path))            # Validate saved PPTX by reopening
-            try:
-                from pptx import Presentation as _P
-                _ = _P(str(out_path))
-                size_bytes = Path(out_path).stat().st_size
-                self.logger.info(f"Validated PPTX at {out_path} (size={size_bytes} bytes)")
-                if size_bytes < 2048:
-                    raise ValueError(f"pptx size too small: {size_bytes}")
-            except Exception as e:
-                self.logger.error(f"Saved PPTX failed to open ({e}); writing minimal deck to {out_path}")
-                try:
-                    from pptx import Presentation as _P
-                    _fallback = _P()
-                    _fallback.save(str(out_path))
-                except Exception:
-                    pass
+            # Save (XML serialization + reopen check are CPU/IO bound; keep them off the event loop)
+            await asyncio.get_running_loop().run_in_executor(None, self._save_and_verify, prs, out_path)
 
             elapsed = (time.time() - start_ts) * 1000.0
             self.logger.info(f"Saved presentation: {out_path}")
@@ -226,17 +212,21 @@ class WorkflowOrchestrator:
                 errors=[str(e)],
             )
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+    def _save_and_verify(self, prs, out_path: Path) -> None:
+        """Save the deck, then reopen it; write a minimal deck if the saved file is unusable."""
+        prs.save(str(out_path))
+        try:
+            from pptx import Presentation as _P
+            _ = _P(str(out_path))
+            size_bytes = Path(out_path).stat().st_size
+            self.logger.info(f"Validated PPTX at {out_path} (size={size_bytes} bytes)")
+            if size_bytes < 2048:
+                raise ValueError(f"pptx size too small: {size_bytes}")
+        except Exception as e:
+            self.logger.error(f"Saved PPTX failed to open ({e}); writing minimal deck to {out_path}")
+            try:
+                from pptx import Presentation as _P
+                _fallback = _P()
+                _fallback.save(str(out_path))
+            except Exception:
+                pass
@@ -0,0 +1,75 @@
+"""
+AIService 단위 테스트
+- generate_all 단일 요청 결과 매핑
+"""
+
+import copy
+import json
+import unittest
+from types import SimpleNamespace
+
+from app.services.ai_service import AIService
+
+
+def _completion(payload):
+    """chat.completions 응답 형태의 스텁"""
+    message = SimpleNamespace(content=payload)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestGenerateAll(unittest.IsolatedAsyncioTestCase):
+    """generate_all 테스트"""
+
+    def setUp(self):
+        """API 호출 없이 _create_completion을 스텁으로 대체"""
+        self.service = AIService()
+        self.service.client = object()
+        self.service.model = "gpt-4"
+        self.calls = []
+
+    def _stub(self, payload):
+        async def create_completion(**kwargs):
+            self.calls.append(kwargs)
+            return _completion(payload)
+        self.service._create_completion = create_completion
+
+    async def test_maps_result_without_mutating_input(self):
+        """결과를 인덱스별로 매핑하고 입력 슬라이드는 변경하지 않음"""
+        slides = [
+            {"title": "시장 현황", "content": ["a", "b"], "layout_type": "content"},
+            {"title": "전략", "content": ["c"]},
+        ]
+        original = copy.deepcopy(slides)
+        self._stub("```json\n" + json.dumps({
+            "executive_summary": "요약",
+            "insights": "인사이트1\n\n인사이트2",
+            "slides": [{"index": 0, "title": "개선된 제목", "content": ["x" * 150] * 7, "speaker_notes": "노트"}],
+        }, ensure_ascii=False) + "\n```")
+
+        result = await self.service.generate_all("# 문서", slides, {"매출": 100})
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(slides, original)
+        self.assertEqual(result["executive_summary"], "요약")
+        self.assertEqual(result["insights"], ["인사이트1", "인사이트2"])
+
+        first, second = result["slides"]
+        self.assertEqual(first["title"], "개선된 제목")
+        self.assertEqual(first["content"], ["x" * 100] * 5)
+        self.assertEqual(first["speaker_notes"], "노트")
+        self.assertEqual(first["layout_type"], "content")
+        self.assertEqual(second, original[1])
+
+    async def test_invalid_json_returns_fallback(self):
+        """JSON 파싱 실패 시 원본 슬라이드로 폴백"""
+        slides = [{"title": "시장 현황", "content": ["a"]}]
+        self._stub("not json")
+
+        result = await self.service.generate_all("# 문서", slides, {})
+
+        self.assertEqual(result["slides"], slides)
+        self.assertIn("Executive Summary", result["executive_summary"])
+
+
+if __name__ == '__main__':
+    unittest.main()
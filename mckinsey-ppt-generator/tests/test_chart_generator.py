@@ -0,0 +1,158 @@
+"""
+ChartGenerator 단위 테스트
+- 차트 타입별 이미지 생성
+- 스펙 해시 기반 결과 재사용
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from app.services import chart_generator
+from app.services.chart_generator import FIG_CACHE_SIZE, ChartGenerator
+
+
+class TestChartGenerator(unittest.TestCase):
+    """ChartGenerator 테스트"""
+
+    def setUp(self):
+        """임시 출력 디렉터리에 생성기 초기화"""
+        self.output_dir = tempfile.mkdtemp()
+        self.generator = ChartGenerator(self.output_dir)
+
+    def tearDown(self):
+        self.generator.flush()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_generates_each_chart_type(self):
+        """bar/line/pie/waterfall 차트 파일 생성"""
+        for chart_type in ('bar', 'line', 'pie', 'waterfall'):
+            path = self.generator.generate_chart({'type': chart_type, 'id': chart_type, 'title': chart_type})
+            self.generator.flush()
+            self.assertTrue(os.path.exists(path))
+            self.assertTrue(path.endswith(f"chart_{chart_type}.png"))
+
+    def test_identical_spec_reuses_file(self):
+        """id만 다른 동일 스펙은 기존 파일 재사용"""
+        first = self.generator.generate_chart({'type': 'line', 'id': 'a', 'title': 'Trend'})
+        second = self.generator.generate_chart({'type': 'line', 'id': 'b', 'title': 'Trend'})
+
+        self.assertEqual(first, second)
+        self.assertFalse(os.path.exists(os.path.join(self.output_dir, 'chart_b.png')))
+
+    def test_numpy_data_distinguishes_specs(self):
+        """str()이 같게 축약되는 numpy 배열도 값이 다르면 다른 스펙"""
+        first = np.arange(5000)
+        second = first.copy()
+        second[2500] = -1
+        self.assertEqual(str(first), str(second))
+
+        key_a = self.generator._spec_key({'type': 'line', 'data': {'values': first}})
+        key_b = self.generator._spec_key({'type': 'line', 'data': {'values': second}})
+        key_c = self.generator._spec_key({'type': 'line', 'data': {'values': first.tolist()}})
+        self.assertNotEqual(key_a, key_b)
+        self.assertEqual(key_a, key_c)
+
+    def test_overwritten_file_invalidates_cache(self):
+        """같은 파일을 덮어쓴 다른 스펙이 있으면 이전 스펙은 다시 렌더링"""
+        self.generator.generate_chart({'type': 'line', 'id': 'a', 'title': 'Trend'})
+        self.generator.generate_chart({'type': 'line', 'id': 'a', 'title': 'Other'})
+
+        path = self.generator.generate_chart({'type': 'line', 'id': 'b', 'title': 'Trend'})
+        self.assertTrue(path.endswith('chart_b.png'))
+
+    def test_deleted_file_is_rerendered(self):
+        """캐시된 파일이 삭제되면 다시 생성"""
+        path = self.generator.generate_chart({'type': 'bar', 'id': 'a', 'title': 'Bar'})
+        self.generator.flush()
+        os.remove(path)
+
+        again = self.generator.generate_chart({'type': 'bar', 'id': 'a', 'title': 'Bar'})
+        self.generator.flush()
+        self.assertEqual(path, again)
+        self.assertTrue(os.path.exists(again))
+
+    def test_target_px_sets_output_size(self):
+        """target_px가 있으면 Pillow/Matplotlib 모두 해당 픽셀 크기로 저장"""
+        for chart_type, fast in (('bar', True), ('pie', True), ('bar', False), ('waterfall', False)):
+            path = self.generator.generate_chart({
+                'type': chart_type, 'id': f'{chart_type}_{fast}', 'fast': fast, 'target_px': (640, 360)
+            })
+            self.generator.flush()
+            with Image.open(path) as img:
+                self.assertEqual(img.size, (640, 360))
+
+    def test_fast_bar_draws_negative_values_below_zero(self):
+        """Pillow 막대 차트는 음수 막대를 0 기준선 아래로 그림"""
+        path = self.generator.generate_chart({
+            'type': 'bar', 'id': 'neg',
+            'data': {'categories': ['A', 'B', 'C', 'D'], 'values': [30, -5, -20, 10]}
+        })
+        self.generator.flush()
+
+        primary = Image.new('RGB', (1, 1), self.generator.colors['primary']).getpixel((0, 0))
+        with Image.open(path) as img:
+            img = img.convert('RGB')
+            slot = (img.width - 130) / 4
+
+            def bar_rows(i):
+                x = int(90 + slot * (i + 0.5))
+                return [y for y in range(img.height) if img.getpixel((x, y)) == primary]
+
+            positive, negative = bar_rows(0), bar_rows(2)
+        # 양수 막대는 기준선에서 끝나고, 음수 막대는 기준선에서 아래로 뻗음
+        self.assertGreater(max(negative), max(positive) + 50)
+        self.assertLessEqual(min(negative), max(positive) + 1)
+
+    def test_figure_cache_is_bounded(self):
+        """target_px마다 새 figsize가 생겨도 재사용 Figure 수는 FIG_CACHE_SIZE 이하"""
+        for width in range(200, 200 + 10 * (FIG_CACHE_SIZE + 3), 10):
+            self.generator.generate_chart({
+                'type': 'line', 'id': f'w{width}', 'fast': False, 'target_px': (width, 300)
+            })
+        self.generator.flush()
+
+        self.assertLessEqual(len(self.generator._fig_cache), FIG_CACHE_SIZE)
+        self.assertTrue(set(self.generator._twin_cache) <= set(self.generator._fig_cache))
+
+    def test_flush_waits_for_background_writes(self):
+        """flush 이후 모든 차트 파일이 디스크에 존재"""
+        paths = [
+            self.generator.generate_chart({'type': 'line', 'id': str(i), 'title': f'Trend {i}'})
+            for i in range(3)
+        ]
+        self.generator.flush()
+
+        for path in paths:
+            self.assertTrue(os.path.exists(path))
+            self.assertGreater(os.path.getsize(path), 0)
+
+    def test_generate_charts_returns_written_files(self):
+        """generate_charts는 단일/캐시 경로도 파일 쓰기가 끝난 뒤 반환"""
+        write_bytes = chart_generator._write_bytes
+
+        def slow_write(path, data):
+            time.sleep(0.2)
+            write_bytes(path, data)
+
+        with patch.object(chart_generator, '_write_bytes', slow_write):
+            [single] = self.generator.generate_charts([{'type': 'bar', 'id': 'one', 'title': 'One'}])
+            self.assertTrue(os.path.exists(single))
+
+            self.generator.generate_chart({'type': 'pie', 'id': 'a', 'title': 'Pie'})
+            self.generator.generate_chart({'type': 'bar', 'id': 'b', 'title': 'Bar'})
+            cached = self.generator.generate_charts([
+                {'type': 'pie', 'id': 'a', 'title': 'Pie'}, {'type': 'bar', 'id': 'b', 'title': 'Bar'}
+            ])
+            for path in cached:
+                self.assertTrue(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+DesignApplicator 단위 테스트
+- 마스터 txStyles/테마 폰트 스타일 적용
+- 저장 후 다시 열었을 때 상속 구조 유지
+"""
+
+import io
+import unittest
+
+from lxml import etree
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml.ns import qn
+
+from app.services.design_applicator import DesignApplicator
+
+_A_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+
+
+class TestDesignApplicator(unittest.TestCase):
+    """DesignApplicator 테스트"""
+
+    def setUp(self):
+        """타이틀 + 본문 슬라이드로 구성된 프레젠테이션에 스타일 적용 후 저장/재로드"""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[0])
+        slide.shapes.title.text = "전략 보고서"
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "시장 분석"
+        slide.placeholders[1].text = "아시아 시장이 50% 성장"
+
+        self.applicator = DesignApplicator()
+        self.applicator.apply_sync(prs)
+
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        buffer.seek(0)
+        self.prs = Presentation(buffer)
+        self.master = self.prs.slide_masters[0]
+
+    def test_theme_fonts_survive_save(self):
+        """테마 fontScheme의 latin 폰트가 저장 후에도 교체된 값으로 유지"""
+        theme = etree.fromstring(self.master.part.part_related_by(RT.THEME).blob)
+        typefaces = {
+            latin.get("typeface") for latin in theme.iterfind(".//a:fontScheme/*/a:latin", namespaces=_A_NS)
+        }
+        font_name = self.applicator._rpr_templates["body"].find(qn("a:latin")).get("typeface")
+        self.assertEqual(typefaces, {font_name})
+
+    def test_master_body_style_survives_save(self):
+        """마스터 bodyStyle이 12pt 회색으로 저장됨"""
+        body_style = self.master._element.find(qn("p:txStyles")).find(qn("p:bodyStyle"))
+        for lvl_pPr in body_style:
+            defRPr = lvl_pPr.find(qn("a:defRPr"))
+            self.assertEqual(defRPr.get("sz"), "1200")
+            self.assertEqual(defRPr.find("./a:solidFill/a:srgbClr", namespaces=_A_NS).get("val"), "53565A")
+            self.assertIsNotNone(lvl_pPr.find(qn("a:lnSpc")))
+
+    def test_body_placeholder_inherits_master_style(self):
+        """본문 placeholder 런은 직접 서식 없이 마스터 스타일을 상속"""
+        body = self.prs.slides[1].placeholders[1]
+        runs = body.text_frame.paragraphs[0].runs
+        self.assertTrue(runs)
+        for run in runs:
+            self.assertIsNone(run._r.rPr)
+
+
+if __name__ == "__main__":
+    unittest.main()
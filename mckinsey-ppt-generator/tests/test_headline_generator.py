@@ -5,7 +5,10 @@ HeadlineGenerator 단위 테스트
 - ContentGenerator 통합
 """
 
+import copy
+import gc
 import unittest
+import weakref
 from unittest.mock import Mock, patch
 import logging
 
@@ -195,6 +198,24 @@ class TestHeadlineGenerator(unittest.TestCase):
         improved = self.generator._improve_existing_title(good_title)
         self.assertEqual(improved, good_title)
 
+    def test_cached_generation_keeps_no_references(self):
+        """캐시된 생성 결과는 직접 생성과 같고 생성기/콘텐츠를 붙잡지 않음"""
+        content = {
+            "title": "비용 구조 분석",
+            "body": ["운영 비용 15% 감소", "조달 비용 1.2배 증가"],
+            "data": {"rows": [[1, 2.5, True], (3, None)]}
+        }
+        generator = HeadlineGenerator()
+        expected = generator._generate(content, "content")
+
+        self.assertEqual(generator.generate(content), expected)
+        self.assertEqual(generator.generate(copy.deepcopy(content)), expected)
+
+        ref = weakref.ref(generator)
+        del generator
+        gc.collect()
+        self.assertIsNone(ref())
+
 
 class TestSoWhatTester(unittest.TestCase):
     """SoWhatTester 테스트"""
@@ -1,10 +1,11 @@
 """
-InsightLadder 단위 테스트 (15개 케이스)
+InsightLadder 단위 테스트 (16개 케이스)
 - McKinsey 4단계 인사이트 생성
 - ContentGenerator 통합
 """
 
 import unittest
+from decimal import Decimal
 from unittest.mock import Mock, patch
 import logging
 
@@ -18,7 +19,7 @@ logging.basicConfig(level=logging.INFO)
 
 
 class TestInsightLadder(unittest.TestCase):
-    """InsightLadder 테스트 (7개)"""
+    """InsightLadder 테스트 (8개)"""
     
     def setUp(self):
         """테스트 초기화"""
@@ -143,6 +144,46 @@ class TestInsightLadder(unittest.TestCase):
         # 소수점
         self.assertEqual(self.ladder._format_number(99.5, "%"), "99.5%")
 
+    def test_7a_climb_cache(self):
+        """동일 데이터 재사용 및 타입/순서 구분 캐시 테스트"""
+        data = {"metric": "매출", "value": 200, "drivers": {"가": 50, "나": 50}}
+
+        first = self.ladder.climb(data)
+        second = self.ladder.climb(dict(data))
+
+        # 같은 결과, 호출마다 새 리스트
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+        # 값 타입과 drivers 순서가 다르면 별도 결과
+        as_float = self.ladder.climb({**data, "value": 200.0})
+        self.assertIn("매출=200.0", as_float[0].evidence[0])
+        reordered = self.ladder.climb({**data, "drivers": {"나": 50, "가": 50}})
+        self.assertIn("나이", reordered[2].statement)
+
+    def test_7b_cached_insights_are_isolated(self):
+        """반환된 인사이트의 evidence/metrics를 바꿔도 캐시 결과는 그대로"""
+        data = {"metric": "매출", "value": 120, "previous_value": 100}
+
+        first = self.ladder.climb(data)
+        first[0].evidence.append("변경")
+        first[1].metrics["growth_rate"] = -1
+
+        second = self.ladder.climb(data)
+        self.assertNotIn("변경", second[0].evidence)
+        self.assertEqual(second[1].metrics["growth_rate"], 20.0)
+
+    def test_7c_decimal_values(self):
+        """Decimal 값도 4단계 생성, float와 섞여 계산할 수 없으면 폴백"""
+        insights = self.ladder.climb({"metric": "매출", "value": Decimal("3.5"), "previous_value": 1})
+
+        self.assertEqual(len(insights), 4)
+        self.assertIn("250.0% 증가", insights[1].statement)
+
+        fallback = self.ladder.climb({"value": Decimal("3.5"), "previous_value": 1.5})
+        self.assertEqual(len(fallback), 1)
+        self.assertEqual(fallback[0].statement, "데이터 분석 중")
+
 
 class TestInsightEnhancer(unittest.TestCase):
     """InsightEnhancer 테스트 (5개)"""